@@ -15,6 +15,14 @@ VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv'}
 # Canvas settings
 CANVAS_WIDTH = 400
 CANVAS_HEIGHT = 300
+CANVAS_BACKGROUND = "lightgray"
+PREVIEW_MIN_INTERVAL = 0.1  # Minimum seconds between preview refreshes
+
+# Video pipeline settings
+VIDEO_QUEUE_SIZE = 32  # Frames buffered between pipeline stages
+VIDEO_MAX_WORKERS = 8  # Upper bound on concurrent frame workers
+VIDEO_BATCH_SIZE = 4  # Frames per session run for models that accept batches
+DIRECTORY_MAX_WORKERS = 4  # Parallel sessions for batch image mode
 
 # Default values
 DEFAULT_FPS = 30
@@ -87,10 +95,13 @@ def validate_rgb_color(r: str, g: str, b: str) -> tuple:
     """
     def clamp_color_value(value_str: str, default: int = 0) -> int:
         try:
-            value = int(float(value_str))  # Handle decimal inputs
-            return max(0, min(255, value))  # Clamp to 0-255
+            value = int(value_str)  # Fast path for plain integers
         except (ValueError, TypeError):
-            return default
+            try:
+                value = int(float(value_str))  # Handle decimal inputs
+            except (ValueError, TypeError):
+                return default
+        return max(0, min(255, value))  # Clamp to 0-255
     
     return (
         clamp_color_value(r, 0),
@@ -1,10 +1,13 @@
 """Core image processing functionality."""
 
+import io
+import itertools
 import json
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable
 
 try:
     from rembg import remove
@@ -13,6 +16,18 @@ try:
 except ImportError:
     PROCESSING_AVAILABLE = False
 
+try:
+    import numpy as np
+    from rembg.bg import naive_cutout
+    BATCH_AVAILABLE = True
+except ImportError:
+    BATCH_AVAILABLE = False
+
+# Models whose rembg session shares U2Net's single-mask pre/post-processing and
+# can therefore be run on a stacked NCHW batch
+BATCH_MODELS = {"u2net", "u2netp", "u2net_human_seg", "silueta"}
+U2NET_INPUT = {"mean": (0.485, 0.456, 0.406), "std": (0.229, 0.224, 0.225), "size": (320, 320)}
+
 try:
     from core.session_manager import SessionManager
     SESSION_AVAILABLE = True
@@ -22,41 +37,41 @@ except ImportError:
 try:
     from utils.logging_utils import Logger
     from utils.file_utils import ensure_directory_exists, get_file_size_mb
-    from utils.system_utils import get_memory_usage, check_available_memory_for_file
+    from utils.system_utils import get_memory_usage, check_available_memory_for_file, snapshot
     UTILS_AVAILABLE = True
 except ImportError:
     UTILS_AVAILABLE = False
 
 
 class ProcessingState:
-    """Thread-safe processing state management for the image processor."""
+    """Thread-safe processing state management for the image processor.
+    
+    Backed by threading.Events so per-frame should_stop polls don't take a lock.
+    """
     
     def __init__(self):
-        self._lock = threading.Lock()
-        self._processing = False
-        self._should_stop = False
+        self._running = threading.Event()
+        self._stop_requested = threading.Event()
     
     def set_processing(self, processing: bool):
         """Set processing state."""
-        with self._lock:
-            self._processing = processing
-            if not processing:
-                self._should_stop = False
+        if processing:
+            self._running.set()
+        else:
+            self._running.clear()
+            self._stop_requested.clear()
     
     def is_processing(self) -> bool:
         """Check if currently processing."""
-        with self._lock:
-            return self._processing and not self._should_stop
+        return self._running.is_set() and not self._stop_requested.is_set()
     
     def stop_processing(self):
         """Signal that processing should stop."""
-        with self._lock:
-            self._should_stop = True
+        self._stop_requested.set()
     
     def should_stop(self) -> bool:
         """Check if processing should stop."""
-        with self._lock:
-            return self._should_stop
+        return self._stop_requested.is_set()
 
 
 class ImageProcessor:
@@ -66,6 +81,8 @@ class ImageProcessor:
         self.session_manager = session_manager
         self.logger = logger
         self._state = ProcessingState()
+        self._worker_state = threading.local()  # Per-worker sessions for parallel directory runs
+        self._batching_failed = set()  # (model, use_gpu) sessions that rejected a batched input
     
     def process_single_image(
         self, 
@@ -74,16 +91,25 @@ class ImageProcessor:
         only_mask: bool = False,
         alpha_matting: bool = False,
         extra_params: str = "",
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        output_image_callback: Optional[Callable] = None
     ) -> bool:
-        """Process a single image."""
+        """Process a single image.
+        
+        If output_image_callback is given it is called with the decoded output
+        PIL image after saving, so previews don't have to re-read the file.
+        """
         if not PROCESSING_AVAILABLE:
             if self.logger:
                 self.logger.error("Processing libraries not available")
             return False
         
+        # Per-file debug output (and the stats gathered only for it) is skipped
+        # entirely unless debug logging is on
+        debug = bool(self.logger and self.logger.is_debug())
+        
         try:
-            if self.logger:
+            if debug:
                 self.logger.debug(f"Starting single image processing: {input_path}")
             
             # Check if we should stop before starting
@@ -92,20 +118,27 @@ class ImageProcessor:
             
             # Validate file size and memory if utils available
             if UTILS_AVAILABLE:
-                file_size = get_file_size_mb(input_path)
-                if self.logger:
+                if debug:
+                    file_size = get_file_size_mb(input_path)
                     self.logger.debug(f"Input file size: {file_size:.2f} MB")
                 
-                # Check if we have enough memory
-                if not check_available_memory_for_file(input_path):
+                # Check if we have enough memory; debug mode also wants usage
+                # figures, so take both from one reading
+                if debug:
+                    memory_check = snapshot(input_path)
+                    file_fits = memory_check.file_fits
+                else:
+                    file_fits = check_available_memory_for_file(input_path)
+                
+                if not file_fits:
                     if self.logger:
                         self.logger.error(f"Insufficient memory for processing {input_path}")
                     return False
                 
                 # Check memory before loading
-                memory_before = get_memory_usage()
-                if self.logger:
-                    self.logger.debug(f"Memory before loading: {memory_before['available_gb']:.2f} GB available")
+                if debug:
+                    memory_before = memory_check.memory_usage
+                    self.logger.debug(f"Memory before loading: {memory_before.available_gb:.2f} GB available")
             
             # Load input data
             try:
@@ -116,87 +149,272 @@ class ImageProcessor:
                     self.logger.error(f"Error reading input file {input_path}", e)
                 return False
             
-            if self.logger:
+            if debug:
                 self.logger.debug(f"Image data loaded, size: {len(input_data) / (1024**2):.2f} MB")
             
             # Check if we should stop after loading
             if self._state.should_stop():
                 return False
             
-            # Parse extra parameters
-            extra_args = self._parse_extra_params(extra_params)
-            
-            # Ensure session is ready
-            if not self.session_manager or not self.session_manager.is_session_ready():
-                if self.logger:
-                    self.logger.error("Session not ready for processing")
+            output_image = self._remove_and_save(
+                Image.open(io.BytesIO(input_data)), output_path,
+                only_mask, alpha_matting, extra_params
+            )
+            if output_image is None:
                 return False
             
-            # Process with rembg
-            if self.logger:
-                self.logger.debug("Starting image processing...")
-            
-            if UTILS_AVAILABLE:
-                memory_pre_process = get_memory_usage()
-            
-            start_time = time.time()
-            
-            try:
-                output_data = remove(
-                    input_data,
-                    session=self.session_manager.get_session(),
-                    only_mask=only_mask,
-                    alpha_matting=alpha_matting,
-                    **extra_args
-                )
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"Error during image processing", e)
-                return False
+            if output_image_callback:
+                output_image_callback(output_image)
             
-            process_time = time.time() - start_time
+            if progress_callback:
+                progress_callback(1, 1, "Complete")
             
-            if UTILS_AVAILABLE:
-                memory_post_process = get_memory_usage()
-                process_memory = memory_pre_process['available_gb'] - memory_post_process['available_gb']
-                
-                if self.logger:
-                    self.logger.debug(f"Processing completed in {process_time:.2f} seconds")
-                    self.logger.debug(f"Processing memory usage: {process_memory:.2f} GB")
-                    self.logger.debug(f"Output data size: {len(output_data) / (1024**2):.2f} MB")
+            return True
             
-            # Check if we should stop before saving
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error processing {input_path}", e)
+            return False
+    
+    def process_image(
+        self,
+        image,
+        output_path: str,
+        only_mask: bool = False,
+        alpha_matting: bool = False,
+        extra_params: str = "",
+        output_image_callback: Optional[Callable] = None
+    ) -> bool:
+        """Process an already-decoded image (PIL image or RGB array).
+        
+        Same as process_single_image but skips reading the input from disk,
+        e.g. for video frames decoded straight into memory.
+        """
+        if not PROCESSING_AVAILABLE:
+            if self.logger:
+                self.logger.error("Processing libraries not available")
+            return False
+        
+        try:
             if self._state.should_stop():
                 return False
             
-            # Save output
-            try:
-                if UTILS_AVAILABLE:
-                    ensure_directory_exists(str(Path(output_path).parent))
-                else:
-                    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(output_path, 'wb') as f:
-                    f.write(output_data)
-                
-                if self.logger:
-                    self.logger.debug(f"Output saved to: {output_path}")
-                
-            except (IOError, PermissionError) as e:
-                if self.logger:
-                    self.logger.error(f"Error saving output to {output_path}", e)
+            if not isinstance(image, Image.Image):
+                image = Image.fromarray(image)
+            
+            output_image = self._remove_and_save(
+                image, output_path, only_mask, alpha_matting, extra_params
+            )
+            if output_image is None:
                 return False
             
-            if progress_callback:
-                progress_callback(1, 1, "Complete")
+            if output_image_callback:
+                output_image_callback(output_image)
             
             return True
             
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Error processing {input_path}", e)
+                self.logger.error(f"Error processing image for {output_path}", e)
             return False
     
+    def _remove_and_save(
+        self,
+        input_image,
+        output_path: str,
+        only_mask: bool,
+        alpha_matting: bool,
+        extra_params: str
+    ):
+        """Run rembg on a PIL image and save the result as PNG.
+        
+        Returns:
+            The output PIL image, or None on failure or stop
+        """
+        # Parse extra parameters
+        extra_args = self._parse_extra_params(extra_params)
+        
+        # Prefer this worker's own session, falling back to the shared one
+        session = getattr(self._worker_state, 'session', None)
+        if session is None and self.session_manager:
+            session = self.session_manager.get_session()
+        if session is None:
+            if self.logger:
+                self.logger.error("Session not ready for processing")
+            return None
+        
+        # Process with rembg
+        debug = bool(self.logger and self.logger.is_debug())
+        if debug:
+            self.logger.debug("Starting image processing...")
+        
+        if UTILS_AVAILABLE and debug:
+            memory_pre_process = get_memory_usage()
+        
+        start_time = time.time()
+        
+        try:
+            # Work on a PIL image so the decoded result stays available for previews
+            output_image = remove(
+                input_image,
+                session=session,
+                only_mask=only_mask,
+                alpha_matting=alpha_matting,
+                **extra_args
+            )
+            output_buffer = io.BytesIO()
+            output_image.save(output_buffer, "PNG")
+            output_data = output_buffer.getvalue()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error during image processing", e)
+            return None
+        
+        process_time = time.time() - start_time
+        
+        if UTILS_AVAILABLE and debug:
+            memory_post_process = get_memory_usage()
+            process_memory = memory_pre_process.available_gb - memory_post_process.available_gb
+            
+            self.logger.debug(f"Processing completed in {process_time:.2f} seconds")
+            self.logger.debug(f"Processing memory usage: {process_memory:.2f} GB")
+            self.logger.debug(f"Output data size: {len(output_data) / (1024**2):.2f} MB")
+        
+        # Check if we should stop before saving
+        if self._state.should_stop():
+            return None
+        
+        # Save output
+        if not self._write_output(output_data, output_path, debug):
+            return None
+        
+        return output_image
+    
+    def _write_output(self, output_data: bytes, output_path: str, debug: bool = False) -> bool:
+        """Write encoded output, creating the parent directory if needed."""
+        try:
+            if UTILS_AVAILABLE:
+                ensure_directory_exists(str(Path(output_path).parent))
+            else:
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(output_path, 'wb') as f:
+                f.write(output_data)
+            
+            if debug:
+                self.logger.debug(f"Output saved to: {output_path}")
+            return True
+            
+        except (IOError, PermissionError) as e:
+            if self.logger:
+                self.logger.error(f"Error saving output to {output_path}", e)
+            return False
+    
+    def supports_batching(self, alpha_matting: bool = False, extra_params: str = "") -> bool:
+        """Check if process_image_batch can run the current session on stacked inputs.
+        
+        Only plain cutouts/masks from U2Net-family models are batched; anything
+        needing rembg's per-image options goes through process_image.
+        """
+        if not (PROCESSING_AVAILABLE and BATCH_AVAILABLE):
+            return False
+        if alpha_matting or extra_params.strip() or not self.session_manager:
+            return False
+        
+        session_info = self.session_manager.get_session_info()
+        return (session_info['model'] in BATCH_MODELS
+                and self._batching_key(session_info) not in self._batching_failed)
+    
+    @staticmethod
+    def _batching_key(session_info: Dict[str, Any]) -> tuple:
+        """Key batching failures by model and provider, not by processor."""
+        return (session_info['model'], session_info['use_gpu'])
+    
+    def process_image_batch(
+        self,
+        images: list,
+        output_paths: List[str],
+        only_mask: bool = False
+    ) -> list:
+        """Remove backgrounds from several images with a single session run.
+        
+        Inputs are preprocessed exactly as rembg does for U2Net and stacked into
+        one NCHW tensor. If the model rejects a batched input, batching is
+        disabled for that model and provider and the images are processed one
+        at a time.
+        
+        Args:
+            images: PIL images, RGB arrays or file paths
+            output_paths: Where to save each result as PNG
+            only_mask: Save the mask instead of the cutout
+            
+        Returns:
+            The output PIL image for each input, or None where it failed
+        """
+        if self._state.should_stop():
+            return [None] * len(images)
+        
+        images = [
+            Image.open(image) if isinstance(image, str)
+            else image if isinstance(image, Image.Image)
+            else Image.fromarray(image)
+            for image in images
+        ]
+        
+        try:
+            masks = self._predict_mask_batch(images)
+        except Exception as e:
+            self._batching_failed.add(self._batching_key(self.session_manager.get_session_info()))
+            if self.logger:
+                self.logger.debug(f"Batched inference unavailable, processing frames individually: {e}")
+            return [
+                self._process_image_result(image, output_path, only_mask)
+                for image, output_path in zip(images, output_paths)
+            ]
+        
+        results = []
+        for image, mask, output_path in zip(images, masks, output_paths):
+            output_image = mask if only_mask else naive_cutout(image.convert('RGBA'), mask)
+            output_buffer = io.BytesIO()
+            output_image.save(output_buffer, "PNG")
+            
+            if self._state.should_stop() or not self._write_output(output_buffer.getvalue(), output_path):
+                results.append(None)
+            else:
+                results.append(output_image)
+        
+        return results
+    
+    def _process_image_result(self, image, output_path: str, only_mask: bool):
+        """Process one image, returning the output image or None."""
+        output_images = []
+        self.process_image(image, output_path, only_mask, output_image_callback=output_images.append)
+        return output_images[0] if output_images else None
+    
+    def _predict_mask_batch(self, images: list) -> list:
+        """Run the session once on a stacked batch and return a mask per image."""
+        session = getattr(self._worker_state, 'session', None) or self.session_manager.get_session()
+        if session is None:
+            raise RuntimeError("Session not ready for processing")
+        
+        # Reuse rembg's own normalisation; each call returns a batch of one
+        inputs = [
+            session.normalize(image, U2NET_INPUT["mean"], U2NET_INPUT["std"], U2NET_INPUT["size"])
+            for image in images
+        ]
+        input_name = next(iter(inputs[0]))
+        batch = np.concatenate([item[input_name] for item in inputs], axis=0)
+        
+        predictions = session.inner_session.run(None, {input_name: batch})[0][:, 0, :, :]
+        
+        masks = []
+        for prediction, image in zip(predictions, images):
+            low, high = prediction.min(), prediction.max()
+            prediction = (prediction - low) / max(high - low, 1e-6)
+            mask = Image.fromarray((prediction * 255).astype("uint8"), mode="L")
+            masks.append(mask.resize(image.size, Image.Resampling.LANCZOS))
+        return masks
+    
     def process_directory(
         self,
         input_dir: str,
@@ -204,8 +422,15 @@ class ImageProcessor:
         only_mask: bool = False,
         alpha_matting: bool = False,
         extra_params: str = "",
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        max_workers: int = 1
     ) -> Dict[str, Any]:
+        """Process all images in a directory, mirroring its structure in output_dir.
+        
+        With max_workers > 1 files are processed on a thread pool where each
+        worker creates its own session once at startup, so inference runs
+        concurrently instead of serialising on the shared session.
+        """
         # Import here to avoid circular imports
         if UTILS_AVAILABLE:
             try:
@@ -258,74 +483,146 @@ class ImageProcessor:
                     self.logger.error(f"Cannot create output directory: {output_dir}", e)
                 return {"total": len(image_files), "successful": 0, "processed_frames": []}
         
-        successful = 0
-        processed_frames = []
-        
-        for i, input_file in enumerate(image_files):
-            if self._state.should_stop():  # Check if stopped
-                break
-            
-            # Maintain directory structure
+        # Maintain directory structure
+        jobs = []
+        for input_file in image_files:
             try:
                 rel_path = input_file.relative_to(input_dir)
                 output_file = Path(output_dir) / rel_path
-                output_file = output_file.with_stem(f"{output_file.stem}_no_bg")
+                jobs.append((input_file, output_file.with_stem(f"{output_file.stem}_no_bg")))
             except Exception as e:
                 if self.logger:
                     self.logger.error(f"Error calculating output path for {input_file}", e)
-                continue
+        
+        process_args = (only_mask, alpha_matting, extra_params)
+        if max_workers > 1 and len(jobs) > 1:
+            processed_frames = self._process_files_parallel(
+                jobs, len(image_files), process_args, progress_callback, max_workers
+            )
+        else:
+            processed_frames = self._process_files_sequential(
+                jobs, len(image_files), process_args, progress_callback
+            )
+        successful = len(processed_frames)
+        
+        if self.logger:
+            self.logger.info(f"Completed: {successful}/{len(image_files)} images processed successfully")
+        
+        return {
+            "total": len(image_files),
+            "successful": successful,
+            "processed_frames": processed_frames
+        }
+    
+    def _process_files_sequential(self, jobs, total: int, process_args: tuple,
+                                  progress_callback: Optional[Callable]) -> List[str]:
+        """Process (input, output) jobs one at a time, reporting before and after each."""
+        processed_frames = []
+        
+        for i, (input_file, output_file) in enumerate(jobs):
+            if self._state.should_stop():  # Check if stopped
+                break
             
             # progress callback with preview information - BEFORE processing
             if progress_callback:
                 # Check if callback accepts extra parameters for preview
                 try:
-                    progress_callback(i, len(image_files), f"Processing: {input_file.name}", 
+                    progress_callback(i, total, f"Processing: {input_file.name}", 
                                     str(input_file), None)
                 except TypeError:
                     # Fallback to standard callback if it doesn't accept extra params
-                    progress_callback(i, len(image_files), f"Processing: {input_file.name}")
+                    progress_callback(i, total, f"Processing: {input_file.name}")
             
-            if self.process_single_image(
-                str(input_file), 
-                str(output_file),
-                only_mask=only_mask,
-                alpha_matting=alpha_matting,
-                extra_params=extra_params
-            ):
-                successful += 1
-                if self.logger:
-                    self.logger.info(f"✓ Processed: {input_file.name}")
-                processed_frames.append(str(output_file))
-                
-                # Call progress callback again with the completed output file - AFTER processing
-                if progress_callback:
-                    try:
-                        progress_callback(i + 1, len(image_files), f"Completed: {input_file.name}",
-                                        str(input_file), str(output_file))
-                    except TypeError:
-                        # Fallback to standard callback
-                        progress_callback(i + 1, len(image_files), f"Completed: {input_file.name}")
-            else:
-                if self.logger:
-                    self.logger.info(f"✗ Failed: {input_file.name}")
-                
-                # Still call progress callback for failed items
-                if progress_callback:
-                    try:
-                        progress_callback(i + 1, len(image_files), f"Failed: {input_file.name}",
-                                        str(input_file), None)
-                    except TypeError:
-                        # Fallback to standard callback
-                        progress_callback(i + 1, len(image_files), f"Failed: {input_file.name}")
+            output_images = []
+            self.process_single_image(
+                str(input_file), str(output_file), *process_args,
+                output_image_callback=output_images.append
+            )
+            self._report_file_result(i + 1, total, input_file, output_file, output_images,
+                                     processed_frames, progress_callback)
+        
+        return processed_frames
+    
+    def _process_files_parallel(self, jobs, total: int, process_args: tuple,
+                                progress_callback: Optional[Callable], max_workers: int) -> List[str]:
+        """Process (input, output) jobs on a thread pool with a session per worker.
+        
+        The first worker uses the shared session, so only max_workers - 1 extra
+        copies of the model are loaded. Results are reported from the calling
+        thread as they complete.
+        """
+        processed_frames = []
+        
+        def process_job(input_file, output_file):
+            output_images = []
+            if not self._state.should_stop():
+                self.process_single_image(
+                    str(input_file), str(output_file), *process_args,
+                    output_image_callback=output_images.append
+                )
+            return output_images
         
         if self.logger:
-            self.logger.info(f"Completed: {successful}/{len(image_files)} images processed successfully")
+            self.logger.info(f"Processing with {max_workers} parallel workers")
         
-        return {
-            "total": len(image_files),
-            "successful": successful,
-            "processed_frames": processed_frames
-        }
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="rembg_worker",
+            initializer=self._init_worker_session,
+            initargs=(itertools.count(),)
+        )
+        try:
+            futures = {
+                executor.submit(process_job, input_file, output_file): (input_file, output_file)
+                for input_file, output_file in jobs
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                input_file, output_file = futures[future]
+                self._report_file_result(completed, total, input_file, output_file, future.result(),
+                                         processed_frames, progress_callback)
+                if self._state.should_stop():
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        return processed_frames
+    
+    def _init_worker_session(self, worker_ids):
+        """Thread pool initializer: give every worker but the first its own rembg session."""
+        if next(worker_ids) == 0:
+            return  # Falls back to the shared session
+        if self.session_manager:
+            self._worker_state.session = self.session_manager.create_worker_session()
+    
+    def _report_file_result(self, current: int, total: int, input_file: Path, output_file: Path,
+                            output_images: list, processed_frames: List[str],
+                            progress_callback: Optional[Callable]):
+        """Log a finished file and pass it to the progress callback."""
+        if output_images:
+            if self.logger:
+                self.logger.info(f"✓ Processed: {input_file.name}")
+            processed_frames.append(str(output_file))
+            
+            # Call progress callback again with the completed output - AFTER processing
+            if progress_callback:
+                try:
+                    progress_callback(current, total, f"Completed: {input_file.name}",
+                                    str(input_file), str(output_file), output_images[0])
+                except TypeError:
+                    # Fallback to standard callback
+                    progress_callback(current, total, f"Completed: {input_file.name}")
+        else:
+            if self.logger:
+                self.logger.info(f"✗ Failed: {input_file.name}")
+            
+            # Still call progress callback for failed items
+            if progress_callback:
+                try:
+                    progress_callback(current, total, f"Failed: {input_file.name}",
+                                    str(input_file), None)
+                except TypeError:
+                    # Fallback to standard callback
+                    progress_callback(current, total, f"Failed: {input_file.name}")
     
     def _parse_extra_params(self, extra_params: str) -> Dict[str, Any]:
         """Parse extra parameters from JSON string."""
@@ -339,6 +636,20 @@ class ImageProcessor:
                 self.logger.info("Warning: Invalid JSON in extra parameters, ignoring")
             return {}
     
+    def composite_on_background(self, image, bg_color: tuple = (0, 255, 0)):
+        """Composite an RGBA PIL image onto a solid background, returning RGB."""
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        
+        # Create background with specified color
+        background = Image.new('RGB', image.size, bg_color)
+        
+        # Composite the image onto the background
+        return Image.alpha_composite(
+            background.convert('RGBA'), 
+            image
+        ).convert('RGB')
+    
     def apply_greenscreen_background(
         self, 
         rgba_image_path: str, 
@@ -354,17 +665,7 @@ class ImageProcessor:
         try:
             # Load the RGBA image
             with Image.open(rgba_image_path) as img:
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
-                
-                # Create background with specified color
-                background = Image.new('RGB', img.size, bg_color)
-                
-                # Composite the image onto the background
-                result = Image.alpha_composite(
-                    background.convert('RGBA'), 
-                    img
-                ).convert('RGB')
+                result = self.composite_on_background(img, bg_color)
                 
                 # Ensure output directory exists
                 if UTILS_AVAILABLE:
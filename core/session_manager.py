@@ -10,6 +10,12 @@ try:
 except ImportError:
     REMBG_AVAILABLE = False
 
+try:
+    import onnxruntime as ort
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
 try:
     from config.settings import CUDA_OPTIONS
     SETTINGS_AVAILABLE = True
@@ -24,10 +30,11 @@ except ImportError:
 
 try:
     from utils.logging_utils import Logger
-    from utils.system_utils import get_memory_usage
+    from utils.system_utils import get_memory_usage, check_gpu_availability, GPU_PROVIDERS
     UTILS_AVAILABLE = True
 except ImportError:
     UTILS_AVAILABLE = False
+    GPU_PROVIDERS = frozenset({'CUDAExecutionProvider', 'ROCMExecutionProvider'})
 
 
 class SessionManager:
@@ -39,10 +46,21 @@ class SessionManager:
         self._session = None
         self._current_model = None
         self._use_gpu = False
+        self._intra_op_threads = None
     
-    def create_session(self, model_name: str, use_gpu: bool = False) -> bool:
-        """Create a new rembg session with thread safety."""
+    def create_session(self, model_name: str, use_gpu: bool = False,
+                       intra_op_threads: Optional[int] = None) -> bool:
+        """Create a new rembg session with thread safety.
+        
+        Args:
+            model_name: rembg model to load
+            use_gpu: Prefer GPU execution providers
+            intra_op_threads: ONNX Runtime threads per inference, so callers that
+                run several inferences at once don't oversubscribe the CPU.
+                None keeps ONNX Runtime's default
+        """
         with self._lock:
+            self._intra_op_threads = intra_op_threads
             return self._create_session_internal(model_name, use_gpu)
     
     def _create_session_internal(self, model_name: str, use_gpu: bool = False) -> bool:
@@ -60,7 +78,7 @@ class SessionManager:
             if UTILS_AVAILABLE:
                 memory_pre = get_memory_usage()
                 if self.logger:
-                    self.logger.debug(f"Memory before session: {memory_pre['available_gb']:.2f} GB available")
+                    self.logger.debug(f"Memory before session: {memory_pre.available_gb:.2f} GB available")
             
             # Determine providers
             providers = self._get_providers(use_gpu)
@@ -69,7 +87,7 @@ class SessionManager:
             start_time = time.time()
             
             try:
-                self._session = new_session(model_name, providers=providers)
+                self._session = self._new_session(model_name, providers)
             except Exception as e:
                 if self.logger:
                     self.logger.error(f"Failed to create session with model {model_name}", e)
@@ -95,7 +113,7 @@ class SessionManager:
             # Check memory after session
             if UTILS_AVAILABLE:
                 memory_post = get_memory_usage()
-                memory_used = memory_pre['available_gb'] - memory_post['available_gb']
+                memory_used = memory_pre.available_gb - memory_post.available_gb
                 if self.logger:
                     self.logger.debug(f"Session memory usage: {memory_used:.2f} GB")
             
@@ -113,9 +131,48 @@ class SessionManager:
             
             return False
     
+    def _new_session(self, model_name: str, providers: List):
+        """Create a rembg session with our ONNX Runtime SessionOptions.
+        
+        rembg's new_session() builds its own options, so construct the model's
+        session class directly when it can be found.
+        """
+        if ORT_AVAILABLE:
+            try:
+                from rembg.sessions import sessions_class
+                for session_class in sessions_class:
+                    if session_class.name() == model_name:
+                        return session_class(model_name, self._build_session_options(), providers=providers)
+            except ImportError:
+                pass
+        
+        return new_session(model_name, providers=providers)
+    
+    def _build_session_options(self):
+        """Build SessionOptions with full graph optimisation and pinned thread counts."""
+        sess_opts = ort.SessionOptions()
+        sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_opts.enable_mem_pattern = True
+        sess_opts.enable_cpu_mem_arena = True
+        
+        if self._intra_op_threads:
+            sess_opts.intra_op_num_threads = self._intra_op_threads
+            sess_opts.inter_op_num_threads = 1
+            if self.logger:
+                self.logger.debug(f"ONNX Runtime intra-op threads: {self._intra_op_threads}")
+        
+        return sess_opts
+    
     def _get_providers(self, use_gpu: bool) -> List:
         """Get ONNX providers based on GPU preference."""
-        if use_gpu and SETTINGS_AVAILABLE:
+        gpu_provider = self._detected_gpu_provider() if use_gpu else None
+        
+        if gpu_provider not in (None, 'CUDAExecutionProvider'):
+            # ROCm-family builds (ROCM/HIP/MIGraphX) take no CUDA options
+            providers = [gpu_provider, 'CPUExecutionProvider']
+            if self.logger:
+                self.logger.debug(f"GPU providers config: {providers}")
+        elif use_gpu and SETTINGS_AVAILABLE:
             providers = [
                 ('CUDAExecutionProvider', CUDA_OPTIONS),
                 'CPUExecutionProvider'
@@ -129,6 +186,15 @@ class SessionManager:
         
         return providers
     
+    def _detected_gpu_provider(self) -> Optional[str]:
+        """Return the GPU provider found by the (cached) GPU probe, if any."""
+        if not UTILS_AVAILABLE:
+            return None
+        try:
+            return check_gpu_availability(verify=True).get('gpu_provider')
+        except Exception:
+            return None
+    
     def _is_gpu_session(self, providers: List) -> bool:
         """Check if the session is actually using GPU."""
         try:
@@ -140,7 +206,7 @@ class SessionManager:
                     else:
                         provider_name = provider
                     
-                    if 'CUDA' in provider_name or 'ROCM' in provider_name:
+                    if provider_name in GPU_PROVIDERS:
                         # Additional check to see if GPU is actually being used
                         try:
                             import onnxruntime as ort
@@ -152,6 +218,29 @@ class SessionManager:
         except Exception:
             return False
     
+    def create_worker_session(self):
+        """Create an extra session matching the current model and providers.
+        
+        Used by parallel workers that each want their own session; the shared
+        session is left untouched.
+        
+        Returns:
+            The new session, or None if no session is configured or creation failed
+        """
+        with self._lock:
+            model_name = self._current_model
+            use_gpu = self._use_gpu
+        
+        if not REMBG_AVAILABLE or model_name is None:
+            return None
+        
+        try:
+            return self._new_session(model_name, self._get_providers(use_gpu))
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Could not create worker session, using shared session: {e}")
+            return None
+    
     def get_session(self):
         """Get the current session with thread safety."""
         with self._lock:
@@ -4,10 +4,11 @@ import os
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator
 
 try:
     import cv2
+    import numpy as np
     VIDEO_AVAILABLE = True
 except ImportError:
     VIDEO_AVAILABLE = False
@@ -60,26 +61,12 @@ class VideoHandler:
         finally:
             cap.release()
     
-    def extract_video_frames(
-        self, 
-        video_path: str, 
-        output_dir: str, 
-        fps: Optional[float] = None,
-        progress_callback: Optional[Callable] = None
-    ) -> List[str]:
-        """Extract frames from video file.
-        
-        Args:
-            video_path: Path to the input video file
-            output_dir: Directory to save extracted frames
-            fps: Target FPS for extraction. If None, uses native video framerate (extracts all frames)
-            progress_callback: Optional callback for progress updates
-        """
+    def _iter_decoded_frames(self, video_path: str, fps: Optional[float] = None,
+                             progress_callback: Optional[Callable] = None) -> Iterator:
+        """Decode the frames selected for the target FPS, yielding BGR arrays."""
         if not VIDEO_AVAILABLE:
             raise Exception("OpenCV not available for video processing")
         
-        ensure_directory_exists(output_dir)
-        
         # Get original video information
         self.original_video_info = self.get_video_info(video_path)
         video_fps = self.original_video_info['fps']
@@ -93,16 +80,12 @@ class VideoHandler:
             raise Exception(f"Could not open video file: {video_path}")
         
         # Determine frame extraction strategy
+        frame_skip = self._get_frame_skip(video_fps, fps)
         if fps is None:
-            # Extract all frames at native framerate
-            frame_skip = 1
             self.logger.info("Extracting ALL frames at native framerate")
         else:
-            # Calculate frame skip to match desired FPS
-            frame_skip = max(1, int(video_fps / fps))
             self.logger.info(f"Video FPS: {video_fps:.2f}, Target FPS: {fps:.2f}, Extracting every {frame_skip} frames")
         
-        frame_files = []
         frame_count = 0
         saved_count = 0
         
@@ -113,10 +96,8 @@ class VideoHandler:
                     break
                 
                 if frame_count % frame_skip == 0:
-                    frame_filename = os.path.join(output_dir, f"frame_{saved_count:06d}.png")
-                    cv2.imwrite(frame_filename, frame)
-                    frame_files.append(frame_filename)
                     saved_count += 1
+                    yield frame
                     
                     if saved_count % 10 == 0 and progress_callback:  # Update every 10 frames
                         progress_callback(frame_count, total_frames, f"Extracting frames: {saved_count}")
@@ -125,10 +106,74 @@ class VideoHandler:
         
         finally:
             cap.release()
+    
+    def iter_video_frames(
+        self, 
+        video_path: str, 
+        output_dir: str, 
+        fps: Optional[float] = None,
+        progress_callback: Optional[Callable] = None
+    ) -> Iterator[str]:
+        """Extract frames from video file, yielding each frame path once it is written.
+        
+        Lets later stages start on the first frames while extraction continues.
+        Arguments are the same as extract_video_frames.
+        """
+        ensure_directory_exists(output_dir)
+        
+        for index, frame in enumerate(self._iter_decoded_frames(video_path, fps, progress_callback)):
+            frame_filename = os.path.join(output_dir, f"frame_{index:06d}.png")
+            cv2.imwrite(frame_filename, frame)
+            yield frame_filename
+    
+    def iter_video_arrays(
+        self,
+        video_path: str,
+        fps: Optional[float] = None,
+        progress_callback: Optional[Callable] = None
+    ) -> Iterator:
+        """Decode frames from video file as RGB arrays without touching disk.
+        
+        Arguments are the same as extract_video_frames, minus output_dir.
+        """
+        for frame in self._iter_decoded_frames(video_path, fps, progress_callback):
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    
+    def extract_video_frames(
+        self, 
+        video_path: str, 
+        output_dir: str, 
+        fps: Optional[float] = None,
+        progress_callback: Optional[Callable] = None
+    ) -> List[str]:
+        """Extract frames from video file.
         
+        Args:
+            video_path: Path to the input video file
+            output_dir: Directory to save extracted frames
+            fps: Target FPS for extraction. If None, uses native video framerate (extracts all frames)
+            progress_callback: Optional callback for progress updates
+        """
+        frame_files = list(self.iter_video_frames(video_path, output_dir, fps, progress_callback))
         self.logger.info(f"Extracted {len(frame_files)} frames from video")
         return frame_files
     
+    def estimate_frame_count(self, video_info: Dict[str, Any], fps: Optional[float] = None) -> int:
+        """Estimate how many frames extraction will produce at the target FPS.
+        
+        Args:
+            video_info: Result of get_video_info
+            fps: Target FPS for extraction. If None, all frames are extracted
+        """
+        frame_skip = self._get_frame_skip(video_info['fps'], fps)
+        return max(1, -(-video_info['frame_count'] // frame_skip))
+    
+    def _get_frame_skip(self, video_fps: float, fps: Optional[float]) -> int:
+        """Get the frame stride that matches the target FPS."""
+        if fps is None:
+            return 1
+        return max(1, int(video_fps / fps))
+    
     def reassemble_video_from_frames(
         self,
         frames_dir: str,
@@ -247,6 +292,76 @@ class VideoHandler:
             self.logger.error("Error in video reassembly", e)
             return False
     
+    def write_video_frames(
+        self,
+        frames: Iterable,
+        output_video_path: str,
+        bg_color: tuple = (0, 255, 0),
+        fps: Optional[float] = None
+    ) -> bool:
+        """Encode processed RGBA frames onto a solid background as they arrive.
+        
+        Unlike reassemble_video_from_frames this needs no intermediate
+        greenscreen files, so it can run alongside inference.
+        
+        Args:
+            frames: Iterable of processed RGBA PIL images, in video order
+            output_video_path: Path for the output video
+            bg_color: Background color RGB tuple
+            fps: Output video FPS. If None, uses original video FPS
+        """
+        if not VIDEO_AVAILABLE:
+            self.logger.error("OpenCV not available for video processing")
+            return False
+        
+        out = None
+        written = 0
+        
+        try:
+            for image in frames:
+                if not self.image_processor.is_processing():  # Check if stopped
+                    break
+                
+                composited = self.image_processor.composite_on_background(image, bg_color)
+                frame = cv2.cvtColor(np.asarray(composited), cv2.COLOR_RGB2BGR)
+                
+                if out is None:
+                    # original_video_info is filled in by the decoder, which has
+                    # produced at least one frame by now
+                    if fps is None:
+                        fps = self.original_video_info.get('fps', 30.0)
+                    self.logger.info(f"Writing video at {fps:.2f} FPS with background color RGB: {bg_color}")
+                    
+                    # Use original video dimensions if available
+                    height, width = frame.shape[:2]
+                    width = self.original_video_info.get('width', width)
+                    height = self.original_video_info.get('height', height)
+                    
+                    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+                    out = cv2.VideoWriter(output_video_path, fourcc, fps, (width, height))
+                
+                # Resize frame if necessary
+                if frame.shape[:2] != (height, width):
+                    frame = cv2.resize(frame, (width, height))
+                
+                out.write(frame)
+                written += 1
+        
+        except Exception as e:
+            self.logger.error("Error writing video frames", e)
+            return False
+        
+        finally:
+            if out is not None:
+                out.release()
+        
+        if written and self.image_processor.is_processing():
+            self.logger.info(f"✓ Video written successfully: {output_video_path} ({written} frames)")
+            return True
+        
+        self.logger.info("Video writing stopped" if written else "No processed frames to write")
+        return False
+    
     def generate_video_output_filename(self, input_video_path: str, output_dir: str) -> str:
         """Generate output video filename with timestamp."""
         input_path = Path(input_video_path)
@@ -2,7 +2,7 @@
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-from typing import Dict, Any, Callable, Optional
+from typing import Any, Callable, Optional
 
 try:
     from config.models import MODELS, ADVANCED_PARAMETERS
@@ -75,27 +75,26 @@ class InputSelectionFrame:
     
     def __init__(self, parent, input_type_var: tk.StringVar, input_path_var: tk.StringVar, 
                  output_path_var: tk.StringVar, filename_format_var: tk.StringVar,
-                 browse_input_callback: Callable, browse_output_callback: Callable,
-                 input_type_change_callback: Callable):
+                 browse_input_callback: Callable, browse_output_callback: Callable):
         self.input_type_var = input_type_var
         self.filename_format_var = filename_format_var
         self.setup_ui(parent, input_path_var, output_path_var, browse_input_callback, 
-                     browse_output_callback, input_type_change_callback)
+                     browse_output_callback)
     
     def setup_ui(self, parent, input_path_var, output_path_var, browse_input_callback, 
-                browse_output_callback, input_type_change_callback):
+                browse_output_callback):
         """Setup the input selection UI."""
         try:
             self.frame = ttk.LabelFrame(parent, text="Input Selection", padding="8")
             self.frame.columnconfigure(1, weight=1)
             
-            # Input type selection
+            # Input type selection (changes are observed through a trace on the variable)
             ttk.Radiobutton(self.frame, text="Single Image", variable=self.input_type_var, 
-                           value="image", command=input_type_change_callback).grid(row=0, column=0, sticky=tk.W)
+                           value="image").grid(row=0, column=0, sticky=tk.W)
             ttk.Radiobutton(self.frame, text="Image Directory", variable=self.input_type_var, 
-                           value="directory", command=input_type_change_callback).grid(row=0, column=1, sticky=tk.W)
+                           value="directory").grid(row=0, column=1, sticky=tk.W)
             ttk.Radiobutton(self.frame, text="Video File", variable=self.input_type_var, 
-                           value="video", command=input_type_change_callback).grid(row=0, column=2, sticky=tk.W)
+                           value="video").grid(row=0, column=2, sticky=tk.W)
             
             # Input path
             ttk.Label(self.frame, text="Input:").grid(row=1, column=0, sticky=tk.W, pady=(8, 0))
@@ -150,15 +149,13 @@ class ProcessingOptionsFrame:
     def __init__(self, parent, selected_model_var: tk.StringVar, model_desc_var: tk.StringVar,
                  model_status_var: tk.StringVar, gpu_status_var: tk.StringVar,
                  only_mask_var: tk.BooleanVar, alpha_matting_var: tk.BooleanVar,
-                 extra_params_var: tk.StringVar, model_change_callback: Callable):
+                 extra_params_var: tk.StringVar):
         self.selected_model_var = selected_model_var
         self.setup_ui(parent, selected_model_var, model_desc_var, model_status_var, 
-                     gpu_status_var, only_mask_var, alpha_matting_var, extra_params_var,
-                     model_change_callback)
+                     gpu_status_var, only_mask_var, alpha_matting_var, extra_params_var)
     
     def setup_ui(self, parent, selected_model_var, model_desc_var, model_status_var, 
-                gpu_status_var, only_mask_var, alpha_matting_var, extra_params_var,
-                model_change_callback):
+                gpu_status_var, only_mask_var, alpha_matting_var, extra_params_var):
         """Setup the processing options UI."""
         try:
             self.frame = ttk.LabelFrame(parent, text="Processing Options", padding="8")
@@ -174,7 +171,6 @@ class ProcessingOptionsFrame:
             model_combo = ttk.Combobox(model_row, textvariable=selected_model_var, 
                                       values=model_values, state="readonly", width=20)
             model_combo.grid(row=0, column=1, sticky=tk.W, padx=(5, 10))
-            model_combo.bind('<<ComboboxSelected>>', model_change_callback)
             
             # GPU/CPU status
             ttk.Label(model_row, textvariable=gpu_status_var, foreground="green").grid(row=0, column=2, sticky=tk.E)
@@ -358,12 +354,15 @@ class VideoOptionsFrame:
     """Frame for video processing options with enhanced tooltips."""
     
     def __init__(self, parent, fps_var: tk.StringVar, reassemble_var: tk.BooleanVar,
-                 bg_color_vars: Dict[str, tk.StringVar], set_bg_color_callback: Callable):
+                 bg_r_var: tk.StringVar, bg_g_var: tk.StringVar, bg_b_var: tk.StringVar,
+                 set_bg_color_callback: Callable):
         self.fps_var = fps_var
-        self.bg_color_vars = bg_color_vars
-        self.setup_ui(parent, fps_var, reassemble_var, bg_color_vars, set_bg_color_callback)
+        self.r_var = bg_r_var
+        self.g_var = bg_g_var
+        self.b_var = bg_b_var
+        self.setup_ui(parent, fps_var, reassemble_var, set_bg_color_callback)
     
-    def setup_ui(self, parent, fps_var, reassemble_var, bg_color_vars, set_bg_color_callback):
+    def setup_ui(self, parent, fps_var, reassemble_var, set_bg_color_callback):
         """Setup the video options UI."""
         try:
             self.frame = ttk.LabelFrame(parent, text="Video Options", padding="8")
@@ -409,19 +408,19 @@ class VideoOptionsFrame:
             
             # RGB input fields with validation and tooltips
             ttk.Label(color_frame, text="R:").grid(row=0, column=0, sticky=tk.W)
-            self.r_entry = ttk.Entry(color_frame, textvariable=bg_color_vars['r'], width=5)
+            self.r_entry = ttk.Entry(color_frame, textvariable=self.r_var, width=5)
             self.r_entry.grid(row=0, column=1, padx=(2, 5))
             self.r_entry.bind('<FocusOut>', lambda e: self._validate_color_component('r'))
             ToolTip(self.r_entry, "Red component (0-255)")
             
             ttk.Label(color_frame, text="G:").grid(row=0, column=2, sticky=tk.W)
-            self.g_entry = ttk.Entry(color_frame, textvariable=bg_color_vars['g'], width=5)
+            self.g_entry = ttk.Entry(color_frame, textvariable=self.g_var, width=5)
             self.g_entry.grid(row=0, column=3, padx=(2, 5))
             self.g_entry.bind('<FocusOut>', lambda e: self._validate_color_component('g'))
             ToolTip(self.g_entry, "Green component (0-255)")
             
             ttk.Label(color_frame, text="B:").grid(row=0, column=4, sticky=tk.W)
-            self.b_entry = ttk.Entry(color_frame, textvariable=bg_color_vars['b'], width=5)
+            self.b_entry = ttk.Entry(color_frame, textvariable=self.b_var, width=5)
             self.b_entry.grid(row=0, column=5, padx=(2, 0))
             self.b_entry.bind('<FocusOut>', lambda e: self._validate_color_component('b'))
             ToolTip(self.b_entry, "Blue component (0-255)")
@@ -477,7 +476,8 @@ class VideoOptionsFrame:
     def _validate_color_component(self, component: str):
         """Validate individual color component."""
         try:
-            value = int(self.bg_color_vars[component].get())
+            color_var = getattr(self, f'{component}_var')
+            value = int(color_var.get())
             if 0 <= value <= 255:
                 self.color_validation_label.grid_remove()
                 getattr(self, f'{component}_entry').config(foreground="black")
@@ -485,7 +485,7 @@ class VideoOptionsFrame:
                 self._show_color_error("RGB values must be 0-255")
                 getattr(self, f'{component}_entry').config(foreground="red")
         except ValueError:
-            if self.bg_color_vars[component].get().strip():  # Only show error if not empty
+            if color_var.get().strip():  # Only show error if not empty
                 self._show_color_error("RGB values must be numbers")
                 getattr(self, f'{component}_entry').config(foreground="red")
             else:
@@ -520,14 +520,12 @@ class VideoOptionsFrame:
         if SETTINGS_AVAILABLE:
             try:
                 r, g, b = validate_rgb_color(
-                    self.bg_color_vars['r'].get(),
-                    self.bg_color_vars['g'].get(),
-                    self.bg_color_vars['b'].get()
+                    self.r_var.get(), self.g_var.get(), self.b_var.get()
                 )
                 # Update with validated values
-                self.bg_color_vars['r'].set(str(r))
-                self.bg_color_vars['g'].set(str(g))
-                self.bg_color_vars['b'].set(str(b))
+                self.r_var.set(str(r))
+                self.g_var.set(str(g))
+                self.b_var.set(str(b))
             except Exception:
                 return False, "Invalid RGB color values"
         
@@ -619,6 +617,21 @@ class ControlFrame:
                 # Fallback to direct call if after() fails
                 update_buttons()
     
+    def set_process_enabled(self, enabled: bool):
+        """Enable or disable the Process button with thread safety."""
+        def update_button():
+            try:
+                if hasattr(self, 'process_btn') and self.process_btn.winfo_exists():
+                    self.process_btn.configure(state="normal" if enabled else "disabled")
+            except tk.TclError:
+                pass
+        
+        if hasattr(self, 'parent'):
+            try:
+                self.parent.after(0, update_button)
+            except tk.TclError:
+                update_button()
+    
     def update_progress(self, value: float):
         """Update progress bar value with thread safety."""
         def update_progress_bar():
@@ -1,12 +1,17 @@
 """Main GUI window for the rembg application."""
 
+import importlib.util
+import os
+import queue
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
-import tempfile
-import atexit
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Iterable
 import weakref
 
 try:
@@ -23,7 +28,8 @@ try:
         DEFAULT_FILENAME_FORMAT, DEFAULT_BG_COLOR,
         IMAGE_FILE_TYPES, VIDEO_FILE_TYPES,
         ensure_output_directory, validate_rgb_color, validate_fps,
-        MAX_IMAGE_SIZE_MB, MAX_VIDEO_SIZE_MB
+        MAX_IMAGE_SIZE_MB, MAX_VIDEO_SIZE_MB, PREVIEW_MIN_INTERVAL,
+        VIDEO_QUEUE_SIZE, VIDEO_MAX_WORKERS, VIDEO_BATCH_SIZE, DIRECTORY_MAX_WORKERS
     )
     SETTINGS_AVAILABLE = True
 except ImportError:
@@ -37,14 +43,11 @@ except ImportError:
     VIDEO_FILE_TYPES = [("Video files", "*.mp4 *.avi *.mov"), ("All files", "*.*")]
     MAX_IMAGE_SIZE_MB = 500
     MAX_VIDEO_SIZE_MB = 2000
-
-try:
-    from core.processor import ImageProcessor
-    from core.session_manager import SessionManager
-    from core.video_handler import VideoHandler
-    CORE_AVAILABLE = True
-except ImportError:
-    CORE_AVAILABLE = False
+    PREVIEW_MIN_INTERVAL = 0.1
+    VIDEO_QUEUE_SIZE = 32
+    VIDEO_MAX_WORKERS = 8
+    VIDEO_BATCH_SIZE = 4
+    DIRECTORY_MAX_WORKERS = 4
 
 try:
     from gui.components import (
@@ -61,58 +64,91 @@ try:
 except ImportError:
     PREVIEW_AVAILABLE = False
 
-try:
-    from utils.logging_utils import Logger
-    from utils.system_utils import check_gpu_availability, get_system_info, check_available_memory_for_file
-    from utils.file_utils import generate_output_filename, validate_file_size, safe_remove_directory
-    UTILS_AVAILABLE = True
-except ImportError:
-    UTILS_AVAILABLE = False
+
+def _modules_available(*names: str) -> bool:
+    """Check that top-level modules can be found without executing them."""
+    return all(importlib.util.find_spec(name) is not None for name in names)
+
+
+# core and utils pull in rembg/onnxruntime/psutil when imported, so only probe
+# for them here and import the names where they are used
+UTILS_AVAILABLE = _modules_available("utils", "psutil")
+CORE_AVAILABLE = UTILS_AVAILABLE and _modules_available("core")
+
+VIDEO_WORKERS = min(VIDEO_MAX_WORKERS, os.cpu_count() or 1)
+DIRECTORY_WORKERS = min(DIRECTORY_MAX_WORKERS, os.cpu_count() or 1)
 
 
 class ProcessingState:
-    """Thread-safe processing state management."""
+    """Thread-safe processing state management.
+    
+    Flags are threading.Events so the hot is_processing/should_stop polls are
+    a single lock-free read; only start_processing takes a lock for atomicity.
+    """
     
     def __init__(self):
-        self._lock = threading.Lock()
-        self._processing = False
-        self._should_stop = False
+        self._start_lock = threading.Lock()
+        self._running = threading.Event()
+        self._stop_requested = threading.Event()
     
     def start_processing(self) -> bool:
         """Start processing if not already running."""
-        with self._lock:
-            if self._processing:
+        with self._start_lock:
+            if self._running.is_set():
                 return False
-            self._processing = True
-            self._should_stop = False
+            self._stop_requested.clear()
+            self._running.set()
             return True
     
     def stop_processing(self):
         """Signal that processing should stop."""
-        with self._lock:
-            self._should_stop = True
+        self._stop_requested.set()
     
     def finish_processing(self):
         """Mark processing as finished."""
-        with self._lock:
-            self._processing = False
-            self._should_stop = False
+        self._running.clear()
+        self._stop_requested.clear()
     
     def is_processing(self) -> bool:
         """Check if currently processing."""
-        with self._lock:
-            return self._processing
+        return self._running.is_set()
     
     def should_stop(self) -> bool:
         """Check if processing should stop."""
-        with self._lock:
-            return self._should_stop
+        return self._stop_requested.is_set()
+
+
+def _cleanup_static(processing_state, session_manager_refs, preview_refs):
+    """Release application resources without holding a reference to the window.
+    
+    Registered through weakref.finalize so it runs once, either from the window
+    close handler or when the MainWindow is collected / the interpreter exits.
+    """
+    try:
+        # Stop any ongoing processing
+        processing_state.stop_processing()
+        
+        # Cleanup session (the list is filled once the core modules have loaded)
+        for session_manager_ref in session_manager_refs:
+            session_manager = session_manager_ref()
+            if session_manager:
+                session_manager.destroy_session()
+        
+        # Cleanup preview canvases
+        for preview_ref in preview_refs:
+            preview = preview_ref()
+            if preview:
+                preview.cleanup_image_references()
+                
+    except Exception as e:
+        print(f"Error during cleanup: {e}")
 
 
 class MainWindow:
     """Main application window."""
     
     def __init__(self):
+        self._init_attrs()
         self.setup_core_components()
         self.setup_window()
         self.setup_variables()
@@ -120,28 +156,49 @@ class MainWindow:
         self.initialize_application()
         self.setup_cleanup()
     
+    def _init_attrs(self):
+        """Give optional components a None default so callers can test `is not None`."""
+        self.logger = None
+        self.session_manager = None
+        self.image_processor = None
+        self.video_handler = None
+        self.input_frame = None
+        self.options_frame = None
+        self.video_frame = None
+        self.control_frame = None
+        self.input_preview = None
+        self.output_preview = None
+        self.log_frame = None
+    
     def setup_core_components(self):
         """Initialize core components."""
         if UTILS_AVAILABLE:
+            from utils.logging_utils import Logger
             self.logger = Logger(debug_mode=True)
         else:
             self.logger = None
         
         self.processing_state = ProcessingState()
-        self.temp_directories = []  # Track temp directories for cleanup
+        self._validation_cache = {}  # (abs path, is_video) -> ((mtime_ns, size), result)
         
-        if CORE_AVAILABLE and UTILS_AVAILABLE:
-            self.session_manager = SessionManager(self.logger)
-            self.image_processor = ImageProcessor(self.session_manager, self.logger)
-            self.video_handler = VideoHandler(self.image_processor, self.logger)
-        else:
-            self.session_manager = None
-            self.image_processor = None
-            self.video_handler = None
+        # The core modules import rembg, onnxruntime and cv2, so they are loaded
+        # in the background once the window is up (see load_core_components)
+        self.session_manager = None
+        self.image_processor = None
+        self.video_handler = None
+        self._session_manager_refs = []  # Weak refs for the cleanup finalizer
+        self._core_load_failed = False
+        self._startup_tasks = set()  # Background startup work that gates the Process button
         
         # State variables
         self.gpu_available = False
         self.use_gpu = False
+        self._last_preview_ts = 0.0  # Monotonic time of the last preview refresh
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None  # Newest (current, total, status) not yet shown
+        self._progress_scheduled = False
+        self._bg_color_cache = (None, None)  # (raw RGB strings, validated tuple)
+        self._fps_cache = (None, None)  # (raw FPS string, validate_fps result)
     
     def setup_window(self):
         """Setup the main window."""
@@ -166,11 +223,13 @@ class MainWindow:
         self.filename_format = tk.StringVar(value=DEFAULT_FILENAME_FORMAT)
         
         # Model variables
+        self._model_desc_map = {
+            name: info.get("description", "") for name, info in MODELS.items()
+        } if MODELS_AVAILABLE else {}
         self.selected_model = tk.StringVar(value=DEFAULT_MODEL)
-        if MODELS_AVAILABLE and DEFAULT_MODEL in MODELS:
-            self.model_desc = tk.StringVar(value=MODELS[DEFAULT_MODEL]["description"])
-        else:
-            self.model_desc = tk.StringVar(value="General use (default)")
+        self.model_desc = tk.StringVar(
+            value=self._model_desc_map.get(DEFAULT_MODEL, "General use (default)")
+        )
         self.gpu_status = tk.StringVar(value="Checking GPU...")
         
         # Processing options
@@ -181,11 +240,25 @@ class MainWindow:
         # Video options
         self.fps_var = tk.StringVar(value="")
         self.reassemble_video = tk.BooleanVar(value=True)
-        self.bg_color_vars = {
-            'r': tk.StringVar(value=str(DEFAULT_BG_COLOR[0])),
-            'g': tk.StringVar(value=str(DEFAULT_BG_COLOR[1])),
-            'b': tk.StringVar(value=str(DEFAULT_BG_COLOR[2]))
-        }
+        self.bg_r = tk.StringVar(value=str(DEFAULT_BG_COLOR[0]))
+        self.bg_g = tk.StringVar(value=str(DEFAULT_BG_COLOR[1]))
+        self.bg_b = tk.StringVar(value=str(DEFAULT_BG_COLOR[2]))
+        
+        # React to value changes directly instead of per-widget command callbacks
+        self._trace_value_changes(self.input_type, self.on_input_type_change)
+        self._trace_value_changes(self.selected_model, self.on_model_change)
+    
+    def _trace_value_changes(self, variable: tk.Variable, handler):
+        """Call handler whenever variable is written with a different value."""
+        last_value = [variable.get()]
+        
+        def on_write(*_):
+            value = variable.get()
+            if value != last_value[0]:
+                last_value[0] = value
+                handler()
+        
+        variable.trace_add("write", on_write)
     
     def setup_ui(self):
         """Setup the user interface."""
@@ -205,8 +278,7 @@ class MainWindow:
             if COMPONENTS_AVAILABLE:
                 self.input_frame = InputSelectionFrame(
                     main_frame, self.input_type, self.input_path, self.output_path, 
-                    self.filename_format, self.browse_input, self.browse_output,
-                    self.on_input_type_change
+                    self.filename_format, self.browse_input, self.browse_output
                 )
                 self.input_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 8))
             
@@ -214,16 +286,15 @@ class MainWindow:
             if COMPONENTS_AVAILABLE:
                 self.options_frame = ProcessingOptionsFrame(
                     main_frame, self.selected_model, self.model_desc, None,
-                    self.gpu_status, self.only_mask, self.alpha_matting, self.extra_params,
-                    self.on_model_change
+                    self.gpu_status, self.only_mask, self.alpha_matting, self.extra_params
                 )
                 self.options_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 8))
             
             # Video options frame (initially hidden)
             if COMPONENTS_AVAILABLE:
                 self.video_frame = VideoOptionsFrame(
-                    main_frame, self.fps_var, self.reassemble_video, self.bg_color_vars,
-                    self.set_bg_color
+                    main_frame, self.fps_var, self.reassemble_video,
+                    self.bg_r, self.bg_g, self.bg_b, self.set_bg_color
                 )
             
             # Control frame (moved above preview images)
@@ -261,7 +332,7 @@ class MainWindow:
                 self.log_frame.grid(row=9, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
                 
                 # Set up logger GUI callback
-                if self.logger and hasattr(self.logger, 'set_gui_callback'):
+                if self.logger is not None:
                     self.logger.set_gui_callback(self.safe_log_output)
             else:
                 self.log_frame = None
@@ -272,51 +343,145 @@ class MainWindow:
     
     def setup_cleanup(self):
         """Setup cleanup procedures."""
-        def cleanup():
-            """Cleanup function for application exit."""
-            try:
-                # Stop any ongoing processing
-                if hasattr(self, 'processing_state'):
-                    self.processing_state.stop_processing()
-                
-                # Cleanup temp directories
-                for temp_dir in getattr(self, 'temp_directories', []):
-                    if UTILS_AVAILABLE:
-                        safe_remove_directory(temp_dir)
-                
-                # Cleanup session
-                if hasattr(self, 'session_manager') and self.session_manager:
-                    self.session_manager.destroy_session()
-                
-                # Cleanup preview canvases
-                if hasattr(self, 'input_preview') and self.input_preview:
-                    self.input_preview.cleanup_image_references()
-                if hasattr(self, 'output_preview') and self.output_preview:
-                    self.output_preview.cleanup_image_references()
-                    
-            except Exception as e:
-                print(f"Error during cleanup: {e}")
+        preview_refs = [
+            weakref.ref(preview)
+            for preview in (self.input_preview, self.output_preview)
+            if preview
+        ]
         
-        atexit.register(cleanup)
+        # The finalizer only holds value copies and weak references, so it never
+        # keeps the window alive and runs at most once
+        self._finalizer = weakref.finalize(
+            self, _cleanup_static,
+            self.processing_state, self._session_manager_refs, preview_refs
+        )
     
     def initialize_application(self):
-        """Initialize the application."""
+        """Initialize the application.
+        
+        System info and GPU detection run concurrently on a small thread pool so
+        ONNX Runtime provider enumeration doesn't block the first paint. The
+        Process button stays disabled until the core modules are loaded and the
+        GPU result is applied, so an early run can't silently fall back to CPU.
+        """
         if self.logger:
             self.logger.info("=== rembg GUI Debug Mode ===")
-            
-            # Log system info
-            if UTILS_AVAILABLE:
-                system_info = get_system_info()
-                self.logger.debug(f"Python version: {system_info['python_version']}")
-                self.logger.debug(f"Platform: {system_info['platform']}")
-                self.logger.debug(f"Available memory: {system_info['available_memory_gb']:.2f} GB")
         
         # Check dependencies and GPU
         self.check_dependencies()
-        self.check_gpu_availability()
+        self.load_core_components()
+        
+        if self.logger:
+            self.logger.debug("=== GPU Availability Check ===")
+        
+        if not UTILS_AVAILABLE:
+            self.gpu_status.set("💻 CPU Only")
+            return
+        
+        from utils.system_utils import check_gpu_availability, get_system_info
+        
+        self.gpu_status.set("Detecting...")
+        self._begin_startup_task("gpu")
+        probe_pool = ThreadPoolExecutor(max_workers=2)
+        probe_pool.submit(get_system_info).add_done_callback(
+            lambda future: self._on_probe_done(future, self._apply_system_info)
+        )
+        probe_pool.submit(check_gpu_availability, True).add_done_callback(
+            lambda future: self._on_probe_done(future, self._apply_gpu_result)
+        )
+        probe_pool.shutdown(wait=False)
+    
+    def load_core_components(self):
+        """Import the core modules on a background thread.
+        
+        They pull in rembg, onnxruntime and cv2, which would otherwise block
+        the first paint. The components are built on the UI thread once the
+        imports finish.
+        """
+        if not (CORE_AVAILABLE and UTILS_AVAILABLE):
+            return
+        
+        self._begin_startup_task("core")
+        threading.Thread(target=self._import_core_components, daemon=True).start()
+    
+    def _import_core_components(self):
+        """Import the core classes and hand them to the UI thread."""
+        try:
+            from core.processor import ImageProcessor
+            from core.session_manager import SessionManager
+            from core.video_handler import VideoHandler
+        except Exception as e:
+            self._core_load_failed = True
+            if self.logger:
+                self.logger.error("Error loading core processing modules", e)
+            try:
+                self.root.after(0, self._end_startup_task, "core")
+            except (tk.TclError, RuntimeError):
+                pass
+            return
+        
+        try:
+            self.root.after(0, self._build_core_components,
+                            SessionManager, ImageProcessor, VideoHandler)
+        except (tk.TclError, RuntimeError):
+            # GUI might be closing
+            pass
+    
+    def _build_core_components(self, session_manager_cls, image_processor_cls, video_handler_cls):
+        """Create the session manager, image processor and video handler."""
+        self.session_manager = session_manager_cls(self.logger)
+        self.image_processor = image_processor_cls(self.session_manager, self.logger)
+        self.video_handler = video_handler_cls(self.image_processor, self.logger)
+        self._session_manager_refs.append(weakref.ref(self.session_manager))
+        
+        if self.logger:
+            self.logger.debug("Core processing modules loaded")
+        
+        self._end_startup_task("core")
+    
+    def _begin_startup_task(self, name: str):
+        """Record pending startup work and disable Process until it finishes."""
+        self._startup_tasks.add(name)
+        if self.control_frame is not None:
+            self.control_frame.set_process_enabled(False)
+    
+    def _end_startup_task(self, name: str):
+        """Mark startup work done; re-enable Process once nothing is pending."""
+        self._startup_tasks.discard(name)
+        if not self._startup_tasks and self.control_frame is not None:
+            self.control_frame.set_process_enabled(True)
+    
+    def _on_probe_done(self, future, handler):
+        """Hand a finished background probe to its handler on the UI thread."""
+        try:
+            self.root.after(0, handler, future)
+        except (tk.TclError, RuntimeError):
+            # GUI might be closing
+            pass
+    
+    def _apply_system_info(self, future):
+        """Log system information gathered in the background."""
+        if not self.logger:
+            return
+        
+        try:
+            system_info = future.result()
+            self.logger.debug(f"Python version: {system_info['python_version']}")
+            self.logger.debug(f"Platform: {system_info['platform']}")
+            self.logger.debug(f"Available memory: {system_info['available_memory_gb']:.2f} GB")
+        except Exception as e:
+            self.logger.error("Error getting system info", e)
     
     def check_dependencies(self):
-        """Check if required dependencies are available."""
+        """Check if required dependencies are available.
+        
+        The import probes load large native libraries, so they run on a
+        background thread to keep the window responsive while they finish.
+        """
+        threading.Thread(target=self._probe_dependencies, daemon=True).start()
+    
+    def _probe_dependencies(self):
+        """Import each dependency and report missing ones back on the UI thread."""
         try:
             missing_deps = []
             
@@ -359,38 +524,32 @@ class MainWindow:
             if missing_deps:
                 error_msg = f"Missing dependencies:\n" + "\n".join(f"- {dep}" for dep in missing_deps)
                 error_msg += "\n\nPlease install with:\npip install \"rembg[gpu,cli]\" pillow opencv-python"
-                messagebox.showerror("Missing Dependencies", error_msg)
+                try:
+                    self.root.after(0, lambda: messagebox.showerror("Missing Dependencies", error_msg))
+                except (tk.TclError, RuntimeError):
+                    # GUI might be closing
+                    print(error_msg)
                 
         except Exception as e:
             if self.logger:
                 self.logger.error("Error checking dependencies", e)
     
-    def check_gpu_availability(self):
-        """Check if GPU acceleration is available."""
-        if self.logger:
-            self.logger.debug("=== GPU Availability Check ===")
-        
-        if not UTILS_AVAILABLE:
-            self.gpu_status.set("💻 CPU Only")
-            return
-        
+    def _apply_gpu_result(self, future):
+        """Apply the result of the GPU availability probe on the UI thread."""
         try:
-            gpu_info = check_gpu_availability()
+            gpu_info = future.result()
             if self.logger:
                 self.logger.debug(f"Available ONNX providers: {gpu_info['providers']}")
+                self.logger.debug(f"Preferred ONNX providers: {gpu_info['preferred_providers']}")
             
-            if gpu_info['cuda_available']:
-                self.use_gpu = True
-                self.gpu_available = True
-                self.gpu_status.set("🚀 GPU (CUDA)")
-                if self.logger:
-                    self.logger.info("✓ GPU (CUDA) acceleration available and enabled")
-            elif gpu_info['rocm_available']:
+            if gpu_info['gpu_available']:
+                # e.g. CUDAExecutionProvider -> CUDA, HIPExecutionProvider -> HIP
+                provider_label = gpu_info['gpu_provider'].replace("ExecutionProvider", "")
                 self.use_gpu = True
                 self.gpu_available = True
-                self.gpu_status.set("🚀 GPU (ROCM)")
+                self.gpu_status.set(f"🚀 GPU ({provider_label})")
                 if self.logger:
-                    self.logger.info("✓ ROCM GPU acceleration available")
+                    self.logger.info(f"✓ GPU ({provider_label}) acceleration available and enabled")
             else:
                 self.use_gpu = False
                 self.gpu_available = False
@@ -403,19 +562,21 @@ class MainWindow:
             self.gpu_status.set("💻 CPU Only")
             if self.logger:
                 self.logger.error("Error checking GPU availability", e)
+        finally:
+            self._end_startup_task("gpu")
     
     def on_input_type_change(self):
         """Handle input type radio button changes."""
         try:
-            if self.input_type.get() == "video" and hasattr(self, 'video_frame'):
+            if self.input_type.get() == "video" and self.video_frame is not None:
                 self.video_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 8))
-            elif hasattr(self, 'video_frame'):
+            elif self.video_frame is not None:
                 self.video_frame.grid_remove()
             
             # Show/hide filename format for single images
-            if self.input_type.get() == "image" and hasattr(self, 'input_frame'):
+            if self.input_type.get() == "image" and self.input_frame is not None:
                 self.input_frame.show_format_frame()
-            elif hasattr(self, 'input_frame'):
+            elif self.input_frame is not None:
                 self.input_frame.hide_format_frame()
             
             # Clear current paths and previews
@@ -430,12 +591,11 @@ class MainWindow:
         """Update model description and information when model is changed."""
         try:
             model = self.selected_model.get()
-            if MODELS_AVAILABLE and model in MODELS:
-                model_info = MODELS.get(model, {})
-                self.model_desc.set(model_info.get("description", ""))
+            if model in self._model_desc_map:
+                self.model_desc.set(self._model_desc_map[model])
                 
                 # Update the detailed model information in the options frame
-                if hasattr(self, 'options_frame') and hasattr(self.options_frame, 'update_model_info'):
+                if self.options_frame is not None:
                     self.options_frame.update_model_info(model)
         except Exception as e:
             if self.logger:
@@ -444,31 +604,58 @@ class MainWindow:
     def set_bg_color(self, r: int, g: int, b: int):
         """Set background color preset."""
         try:
-            self.bg_color_vars['r'].set(str(r))
-            self.bg_color_vars['g'].set(str(g))
-            self.bg_color_vars['b'].set(str(b))
+            self.bg_r.set(str(r))
+            self.bg_g.set(str(g))
+            self.bg_b.set(str(b))
         except Exception as e:
             if self.logger:
                 self.logger.debug(f"Error setting background color: {e}")
     
+    def bg_color(self) -> tuple[int, int, int]:
+        """Get the validated background color, reusing the last result while unchanged."""
+        if not SETTINGS_AVAILABLE:
+            return DEFAULT_BG_COLOR
+        
+        raw_color = (self.bg_r.get(), self.bg_g.get(), self.bg_b.get())
+        if raw_color != self._bg_color_cache[0]:
+            self._bg_color_cache = (raw_color, validate_rgb_color(*raw_color))
+        return self._bg_color_cache[1]
+    
     def validate_file_before_processing(self, file_path: str) -> tuple[bool, str]:
         """Validate file before processing."""
         if not UTILS_AVAILABLE:
             return True, ""
         
+        from utils.file_utils import validate_file_size
+        from utils.system_utils import check_available_memory_for_file
+        
         try:
-            # Check file size
+            # Stat once and reuse the result for every check
+            st = os.stat(file_path)
+            file_size_mb = st.st_size / (1024**2)
             is_video = self.input_type.get() == "video"
-            size_valid, size_msg = validate_file_size(file_path, is_video)
+            
+            # Skip revalidation when re-selecting an unchanged file
+            cache_key = (os.path.abspath(file_path), is_video)
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._validation_cache.get(cache_key)
+            if cached and cached[0] == signature:
+                return cached[1]
+            
+            # Check file size
+            size_valid, size_msg = validate_file_size(file_path, is_video, size_mb=file_size_mb)
             if not size_valid:
-                return False, size_msg
+                result = (False, size_msg)
+                self._validation_cache[cache_key] = (signature, result)
+                return result
             
-            # Check available memory
-            if not check_available_memory_for_file(file_path):
-                file_size_mb = Path(file_path).stat().st_size / (1024**2)
+            # Check available memory (not cached, free memory changes over time)
+            if not check_available_memory_for_file(file_path, file_size=st.st_size):
                 return False, f"Insufficient memory for file ({file_size_mb:.1f}MB). Close other applications and try again."
             
-            return True, ""
+            result = (True, "")
+            self._validation_cache[cache_key] = (signature, result)
+            return result
             
         except Exception as e:
             return False, f"Error validating file: {e}"
@@ -562,7 +749,7 @@ class MainWindow:
         """Thread-safe log output."""
         def log_message():
             try:
-                if hasattr(self, 'log_frame') and self.log_frame:
+                if self.log_frame is not None:
                     self.log_frame.add_message(message)
             except Exception as e:
                 print(f"Error logging message: {e}")
@@ -576,41 +763,75 @@ class MainWindow:
     def clear_log(self):
         """Clear the log output."""
         try:
-            if hasattr(self, 'log_frame') and self.log_frame:
+            if self.log_frame is not None:
                 self.log_frame.clear()
         except Exception as e:
             if self.logger:
                 self.logger.debug(f"Error clearing log: {e}")
     
     def safe_update_progress(self, current: int, total: int, status: str = ""):
-        """Thread-safe progress update."""
-        def update_gui():
-            try:
-                if hasattr(self, 'control_frame') and self.control_frame:
-                    if total > 0:
-                        progress_value = (current / total) * 100
-                        self.control_frame.update_progress(progress_value)
-                    
-                    if status:
-                        self.control_frame.update_status(status)
-                    else:
-                        self.control_frame.update_status(f"Processing {current}/{total}")
-            except Exception as e:
-                if self.logger:
-                    self.logger.debug(f"Error updating progress: {e}")
+        """Thread-safe progress update.
+        
+        Updates are coalesced: only the newest one is kept, and a single Tk
+        callback shows it at most once per frame (~16 ms).
+        """
+        with self._progress_lock:
+            self._pending_progress = (current, total, status)
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
         
         try:
-            self.root.after(0, update_gui)
+            self.root.after(16, self._flush_progress)
         except tk.TclError:
-            pass
+            with self._progress_lock:
+                self._progress_scheduled = False
+    
+    def _flush_progress(self):
+        """Show the pending progress update. Runs on the Tk thread."""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_scheduled = False
+        
+        if pending is None or self.control_frame is None:
+            return
+        
+        current, total, status = pending
+        try:
+            if total > 0:
+                progress_value = (current / total) * 100
+                self.control_frame.update_progress(progress_value)
+            
+            if status:
+                self.control_frame.update_status(status)
+            else:
+                self.control_frame.update_status(f"Processing {current}/{total}")
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Error updating progress: {e}")
+    
+    def _preview_due(self, is_final: bool = False) -> bool:
+        """Check if a preview refresh is due, throttled to PREVIEW_MIN_INTERVAL.
+        
+        The final update of a run is always let through so the last result is shown.
+        """
+        now = time.monotonic()
+        if not is_final and now - self._last_preview_ts < PREVIEW_MIN_INTERVAL:
+            return False
+        self._last_preview_ts = now
+        return True
     
     def safe_update_progress_with_preview(self, current: int, total: int, status: str = "", 
-                                         input_file: str = None, output_file: str = None):
+                                         input_file: str = None, output_file: str = None,
+                                         output_image=None):
         """Thread-safe progress update with preview support for directory processing."""
+        update_preview = self._preview_due(is_final=total > 0 and current >= total)
+        
         def update_gui():
             try:
                 # Update progress bar and status
-                if hasattr(self, 'control_frame') and self.control_frame:
+                if self.control_frame is not None:
                     if total > 0:
                         progress_value = (current / total) * 100
                         self.control_frame.update_progress(progress_value)
@@ -620,20 +841,27 @@ class MainWindow:
                     else:
                         self.control_frame.update_status(f"Processing {current}/{total}")
                 
+                if not update_preview:
+                    return
+                
                 # Update input preview if file is provided
                 if input_file and self.input_preview:
                     self.input_preview.update_image(input_file)
                 
-                # Update output preview based on output file availability
+                # Update output preview, preferring the in-memory result over the file
                 if self.output_preview:
-                    if output_file and Path(output_file).exists():
-                        self.output_preview.update_image(output_file)
-                    elif "Failed" in status:
-                        self.output_preview.set_error_message("Processing failed")
-                    elif "Processing" in status:
-                        self.output_preview.set_default_message("Processing...")
-                    elif "Completed" in status and not output_file:
-                        self.output_preview.set_error_message("Output file not found")
+                    if output_image is not None:
+                        self.output_preview.update_image_from_pil(output_image)
+                    else:
+                        # Opened and shown in a single attempt, no separate exists() check
+                        shown = bool(output_file) and self.output_preview.update_image(output_file)
+                        if not shown:
+                            if "Failed" in status:
+                                self.output_preview.set_error_message("Processing failed")
+                            elif "Processing" in status:
+                                self.output_preview.set_default_message("Processing...")
+                            elif "Completed" in status and not output_file:
+                                self.output_preview.set_error_message("Output file not found")
                         
             except Exception as e:
                 if self.logger:
@@ -644,20 +872,32 @@ class MainWindow:
         except tk.TclError:
             pass
     
-    def safe_update_preview(self, input_file: str, output_file: str = None):
-        """Thread-safe preview update."""
+    def safe_update_preview(self, input_file: Optional[str], output_file: str = None, force: bool = False,
+                            output_image=None, input_image=None):
+        """Thread-safe preview update, throttled unless force is set.
+        
+        input_image/output_image take precedence over the file paths when given.
+        """
+        if not self._preview_due(is_final=force):
+            return
+        
         def update_gui():
             try:
                 # Update input preview
                 if self.input_preview:
-                    self.input_preview.update_image(input_file)
+                    if input_image is not None:
+                        self.input_preview.update_image_from_pil(input_image)
+                    elif input_file:
+                        self.input_preview.update_image(input_file)
                 
                 # Update output preview if available
                 if self.output_preview:
-                    if output_file and Path(output_file).exists():
-                        self.output_preview.update_image(output_file)
+                    if output_image is not None:
+                        self.output_preview.update_image_from_pil(output_image)
                     else:
-                        self.output_preview.set_default_message("Processing...")
+                        shown = bool(output_file) and self.output_preview.update_image(output_file)
+                        if not shown:
+                            self.output_preview.set_default_message("Processing...")
             except Exception as e:
                 if self.logger:
                     self.logger.debug(f"Error updating preview: {e}")
@@ -682,28 +922,28 @@ class MainWindow:
                 return False, "Please select input and output paths", {}
             
             # Video options validation
-            if self.input_type.get() == "video" and hasattr(self, 'video_frame'):
+            if self.input_type.get() == "video" and self.video_frame is not None:
                 is_valid, error_msg = self.video_frame.validate_all_inputs()
                 if not is_valid:
                     return False, error_msg, {}
             
-            # Get validated FPS
+            # Get validated FPS, reusing the last result while the text is unchanged
             fps = None
             if SETTINGS_AVAILABLE:
-                is_valid, fps = validate_fps(self.fps_var.get())
-                if not is_valid and self.fps_var.get().strip():
+                raw_fps = self.fps_var.get()
+                if raw_fps == self._fps_cache[0]:
+                    is_valid, fps = self._fps_cache[1]
+                else:
+                    is_valid, fps = validate_fps(raw_fps)
+                    self._fps_cache = (raw_fps, (is_valid, fps))
+                if not is_valid and raw_fps.strip():
                     return False, "Invalid FPS value", {}
             
             # Get validated RGB colors
-            bg_color = DEFAULT_BG_COLOR
-            if SETTINGS_AVAILABLE:
-                bg_color = validate_rgb_color(
-                    self.bg_color_vars['r'].get(),
-                    self.bg_color_vars['g'].get(),
-                    self.bg_color_vars['b'].get()
-                )
+            bg_color = self.bg_color()
             
             return True, "", {
+                'input_type': self.input_type.get(),
                 'input_path': input_path,
                 'output_path': output_path,
                 'fps': fps,
@@ -719,33 +959,22 @@ class MainWindow:
         except Exception as e:
             return False, f"Error validating inputs: {e}", {}
     
-    def create_temp_directory(self) -> str:
-        """Create and track a temporary directory."""
-        try:
-            temp_dir = tempfile.mkdtemp(prefix="rembg_video_")
-            self.temp_directories.append(temp_dir)
-            return temp_dir
-        except Exception as e:
-            if self.logger:
-                self.logger.error("Error creating temp directory", e)
-            raise
-    
-    def processing_thread(self):
-        """Main processing thread with comprehensive error handling."""
-        temp_dir = None
+    def processing_thread(self, inputs: Dict[str, Any]):
+        """Main processing thread with comprehensive error handling.
         
+        Args:
+            inputs: Validated inputs, read from the Tk variables before the thread started
+        """
         try:
             if self.logger:
                 self.logger.debug("=== Processing Thread Started ===")
             
-            # Get validated inputs
-            is_valid, error_msg, inputs = self.get_validated_inputs()
-            if not is_valid:
-                self.root.after(0, lambda: messagebox.showerror("Input Error", error_msg))
-                return
+            input_type = inputs['input_type']
             
             # Create session
-            if not self.session_manager or not self.session_manager.create_session(inputs['model'], self.use_gpu):
+            if not self.session_manager or not self.session_manager.create_session(
+                inputs['model'], self.use_gpu, intra_op_threads=self._session_thread_count(input_type)
+            ):
                 self.root.after(0, lambda: messagebox.showerror("Error", "Failed to create processing session"))
                 return
             
@@ -754,102 +983,53 @@ class MainWindow:
                 acceleration = "GPU" if self.use_gpu else "CPU"
                 self.logger.info(f"Using {acceleration} acceleration")
             
-            input_type = self.input_type.get()
-            
             if input_type == "image":
                 self.safe_update_progress(0, 1, "Processing image...")
-                output_file = generate_output_filename(
-                    inputs['input_path'], inputs['output_path'], inputs['filename_format']
-                ) if UTILS_AVAILABLE else str(Path(inputs['output_path']) / "output.png")
+                if UTILS_AVAILABLE:
+                    from utils.file_utils import generate_output_filename
+                    output_file = generate_output_filename(
+                        inputs['input_path'], inputs['output_path'], inputs['filename_format']
+                    )
+                else:
+                    output_file = str(Path(inputs['output_path']) / "output.png")
                 
+                output_images = []
                 success = self.image_processor.process_single_image(
                     inputs['input_path'], output_file,
                     inputs['only_mask'], inputs['alpha_matting'],
-                    inputs['extra_params'], self.safe_update_progress
+                    inputs['extra_params'], self.safe_update_progress,
+                    output_image_callback=output_images.append
                 )
                 
                 if success and self.output_preview:
-                    self.root.after(100, lambda: self.safe_update_preview(inputs['input_path'], output_file))
+                    output_image = output_images[0] if output_images else None
+                    self.root.after(100, lambda: self.safe_update_preview(
+                        inputs['input_path'], output_file, force=True, output_image=output_image
+                    ))
                 
                 self.safe_update_progress(1, 1, "Complete" if success else "Failed")
             
             elif input_type == "directory":
                 # Create a custom progress callback that handles the enhanced parameters
-                def directory_progress_callback(current, total, status, input_file=None, output_file=None):
+                def directory_progress_callback(current, total, status, input_file=None, output_file=None,
+                                                output_image=None):
                     if not self.processing_state.should_stop():
                         # Use the enhanced progress callback for directory processing
-                        self.safe_update_progress_with_preview(current, total, status, input_file, output_file)
+                        self.safe_update_progress_with_preview(current, total, status, input_file, output_file,
+                                                               output_image)
                 
                 result = self.image_processor.process_directory(
                     inputs['input_path'], inputs['output_path'],
                     inputs['only_mask'], inputs['alpha_matting'],
-                    inputs['extra_params'], directory_progress_callback
+                    inputs['extra_params'], directory_progress_callback,
+                    max_workers=DIRECTORY_WORKERS
                 )
                 
                 if self.logger:
                     self.logger.info(f"Directory processing complete: {result['successful']}/{result['total']} files")
             
             elif input_type == "video":
-                temp_dir = self.create_temp_directory()
-                if self.logger:
-                    self.logger.info(f"Extracting video frames to: {temp_dir}")
-                
-                # Extract frames
-                frame_files = self.video_handler.extract_video_frames(
-                    inputs['input_path'], temp_dir, inputs['fps'], self.safe_update_progress
-                )
-                
-                if frame_files and self.processing_state.is_processing():
-                    processed_frames_dir = Path(inputs['output_path']) / "processed_frames"
-                    processed_frames_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Process frames with preview updates
-                    def progress_callback_with_preview(current, total, status):
-                        if not self.processing_state.should_stop():
-                            self.safe_update_progress(current, total, status)
-                            
-                            # Update previews during processing
-                            if current > 0 and current <= len(frame_files):
-                                input_frame = frame_files[current - 1]
-                                frame_name = Path(input_frame).name
-                                output_frame_name = frame_name.replace('.png', '_no_bg.png')
-                                output_frame = processed_frames_dir / output_frame_name
-                                
-                                self.safe_update_preview(
-                                    input_frame, 
-                                    str(output_frame) if output_frame.exists() else None
-                                )
-                    
-                    # Set the image processor to use our processing state
-                    if self.image_processor:
-                        original_is_processing = self.image_processor.is_processing
-                        self.image_processor.is_processing = lambda: self.processing_state.is_processing() and not self.processing_state.should_stop()
-                    
-                    result = self.image_processor.process_directory(
-                        temp_dir, str(processed_frames_dir),
-                        inputs['only_mask'], inputs['alpha_matting'],
-                        inputs['extra_params'], progress_callback_with_preview
-                    )
-                    
-                    # Restore original is_processing method
-                    if self.image_processor:
-                        self.image_processor.is_processing = original_is_processing
-                    
-                    # Reassemble video if requested
-                    if (inputs['reassemble_video'] and result.get("processed_frames") and 
-                        self.processing_state.is_processing() and not self.processing_state.should_stop()):
-                        
-                        output_video_path = self.video_handler.generate_video_output_filename(
-                            inputs['input_path'], inputs['output_path']
-                        )
-                        
-                        if self.video_handler.reassemble_video_from_frames(
-                            str(processed_frames_dir), output_video_path, 
-                            inputs['bg_color'], inputs['fps'], 
-                            progress_callback=self.safe_update_progress
-                        ):
-                            if self.logger:
-                                self.logger.info("✓ Video processing complete!")
+                self.process_video(inputs)
         
         except Exception as e:
             if self.logger:
@@ -862,21 +1042,18 @@ class MainWindow:
                 if self.session_manager:
                     self.session_manager.destroy_session()
                 
-                if temp_dir and UTILS_AVAILABLE:
-                    safe_remove_directory(temp_dir)
-                    if temp_dir in self.temp_directories:
-                        self.temp_directories.remove(temp_dir)
-                
             except Exception as e:
                 if self.logger:
                     self.logger.debug(f"Error in cleanup: {e}")
             
-            # Reset GUI state
+            # Reset GUI state, dropping any coalesced progress so it can't land after the reset
             self.processing_state.finish_processing()
+            with self._progress_lock:
+                self._pending_progress = None
             
             def reset_gui():
                 try:
-                    if hasattr(self, 'control_frame') and self.control_frame:
+                    if self.control_frame is not None:
                         self.control_frame.set_processing_state(False)
                         self.control_frame.update_progress(0)
                         self.control_frame.update_status("Ready")
@@ -889,25 +1066,348 @@ class MainWindow:
             except tk.TclError:
                 pass
     
+    def _session_thread_count(self, input_type: str) -> int:
+        """Split the physical cores between the inferences that run concurrently."""
+        import psutil
+        
+        physical_cores = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+        if input_type == "video":
+            concurrent = VIDEO_WORKERS
+        elif input_type == "directory":
+            concurrent = DIRECTORY_WORKERS
+        else:
+            concurrent = 1
+        return max(1, physical_cores // concurrent)
+    
+    @contextmanager
+    def _job_temp_directory(self, prefix: str):
+        """Temporary directory for one job, removed in the background afterwards.
+        
+        Deleting thousands of extracted frames can take a while, so the GUI is
+        reset straight away while a (non-daemon) thread finishes the cleanup.
+        """
+        import tempfile
+        from utils.file_utils import safe_remove_directory
+        
+        temp_dir = tempfile.mkdtemp(prefix=prefix)
+        try:
+            yield temp_dir
+        finally:
+            threading.Thread(
+                target=safe_remove_directory, args=(temp_dir,), name="rembg_cleanup"
+            ).start()
+    
+    def process_video(self, inputs: Dict[str, Any]):
+        """Run the video pipeline: extract frames, remove backgrounds, reassemble.
+        
+        The stages run concurrently, connected by bounded queues: an extractor
+        thread feeds decoded frames to the inference pool, and a muxer thread
+        encodes finished frames straight into the output video.
+        
+        Decoded frames are kept in memory when there is room for the queued
+        frames; otherwise they are extracted as PNGs into a temporary directory
+        scoped to this job.
+        """
+        video_info = self.video_handler.get_video_info(inputs['input_path'])
+        total = self.video_handler.estimate_frame_count(video_info, inputs['fps'])
+        in_memory = self._frames_fit_in_memory(video_info)
+        
+        # Only the on-disk path needs a temporary directory for extracted frames
+        frames_dir = nullcontext() if in_memory else self._job_temp_directory("rembg_video_")
+        with frames_dir as temp_dir:
+            if self.logger:
+                if in_memory:
+                    self.logger.info("Decoding video frames in memory")
+                else:
+                    self.logger.info(f"Extracting video frames to: {temp_dir}")
+            
+            processed_frames_dir = Path(inputs['output_path']) / "processed_frames"
+            processed_frames_dir.mkdir(parents=True, exist_ok=True)
+            
+            extract_q = queue.Queue(maxsize=VIDEO_QUEUE_SIZE)
+            infer_q = queue.Queue(maxsize=VIDEO_QUEUE_SIZE) if inputs['reassemble_video'] else None
+            errors = []
+            mux_result = []
+            
+            def extract_worker():
+                try:
+                    if in_memory:
+                        frames = self.video_handler.iter_video_arrays(inputs['input_path'], inputs['fps'])
+                    else:
+                        frames = self.video_handler.iter_video_frames(
+                            inputs['input_path'], temp_dir, inputs['fps']
+                        )
+                    for frame in frames:
+                        if not self._queue_put(extract_q, frame):
+                            break
+                except Exception as e:
+                    errors.append(e)
+                finally:
+                    self._queue_put(extract_q, None)
+            
+            # Set once the muxer has consumed infer_q's end-of-stream sentinel
+            mux_drained = []
+            
+            def finished_frames():
+                yield from self._iter_queue(infer_q)
+                mux_drained.append(True)
+            
+            def mux_worker():
+                try:
+                    output_video_path = self.video_handler.generate_video_output_filename(
+                        inputs['input_path'], inputs['output_path']
+                    )
+                    mux_result.append(self.video_handler.write_video_frames(
+                        finished_frames(), output_video_path,
+                        inputs['bg_color'], inputs['fps']
+                    ))
+                except Exception as e:
+                    errors.append(e)
+                finally:
+                    # If the writer stopped early, keep draining so the inference
+                    # stage never blocks on a full queue
+                    if not mux_drained:
+                        for _ in self._iter_queue(infer_q):
+                            pass
+            
+            # Latest frame skipped by the preview throttle, shown once the run ends
+            skipped_preview = []
+            
+            def show_frame_preview(input_frame, output_file, output_image):
+                is_path = isinstance(input_frame, str)
+                self.safe_update_preview(
+                    input_frame if is_path else None, output_file,
+                    force=True,  # Already throttled by the caller
+                    output_image=output_image,
+                    input_image=None if is_path else input_frame
+                )
+            
+            # Process frames with preview updates
+            def progress_callback_with_preview(current, total, status, input_frame=None,
+                                               output_file=None, output_image=None):
+                if infer_q is not None and output_image is not None:
+                    self._queue_put(infer_q, output_image)
+                
+                if not self.processing_state.should_stop():
+                    # Progress is cheap and always sent; previews are rate limited
+                    self.safe_update_progress(current, total, status)
+                    
+                    # Update previews once a frame has been processed
+                    if input_frame is not None and (output_image is not None or output_file):
+                        skipped_preview.clear()
+                        if self._preview_due(is_final=current >= total):
+                            show_frame_preview(input_frame, output_file, output_image)
+                        else:
+                            skipped_preview.append((input_frame, output_file, output_image))
+            
+            # Set the image processor to use our processing state
+            if self.image_processor:
+                original_is_processing = self.image_processor.is_processing
+                self.image_processor.is_processing = lambda: self.processing_state.is_processing() and not self.processing_state.should_stop()
+            
+            extract_thread = threading.Thread(target=extract_worker, daemon=True)
+            mux_thread = threading.Thread(target=mux_worker, daemon=True) if infer_q is not None else None
+            
+            try:
+                extract_thread.start()
+                if mux_thread:
+                    mux_thread.start()
+                
+                processed_frames = self._run_video_pipeline(
+                    self._iter_queue(extract_q), total,
+                    str(processed_frames_dir), inputs, progress_callback_with_preview
+                )
+            except BaseException:
+                # Unblock the other stages before propagating
+                self.processing_state.stop_processing()
+                raise
+            finally:
+                if mux_thread:
+                    self._queue_put(infer_q, None)
+                    mux_thread.join()
+                extract_thread.join()
+                
+                # Restore original is_processing method
+                if self.image_processor:
+                    self.image_processor.is_processing = original_is_processing
+            
+            if errors:
+                raise errors[0]
+            
+            # total is only an estimate, so make sure the last processed frame is shown
+            if skipped_preview and not self.processing_state.should_stop():
+                show_frame_preview(*skipped_preview[0])
+            
+            if self.logger:
+                self.logger.info(f"Completed: {len(processed_frames)} frames processed successfully")
+                if mux_result and mux_result[0]:
+                    self.logger.info("✓ Video processing complete!")
+    
+    def _frames_fit_in_memory(self, video_info: Dict[str, Any]) -> bool:
+        """Check whether queued video frames can be buffered in RAM instead of on disk."""
+        if not UTILS_AVAILABLE:
+            return False
+        
+        from utils.system_utils import get_memory_usage
+        
+        pixels = video_info['width'] * video_info['height']
+        # RGB frames queued or in flight, plus RGBA results waiting for the muxer
+        projected = pixels * (3 * (VIDEO_QUEUE_SIZE + 2 * VIDEO_WORKERS) + 4 * VIDEO_QUEUE_SIZE)
+        available = get_memory_usage().available_gb * (1024 ** 3)
+        
+        # Leave the same again as headroom for inference itself
+        return available > 2 * projected
+    
+    def _queue_put(self, q, item) -> bool:
+        """Put an item on a bounded queue, giving up if processing is stopped."""
+        while True:
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                # Retry unless the consumer is going away
+                if self.processing_state.should_stop():
+                    return False
+    
+    def _iter_queue(self, q):
+        """Yield items from a queue until the None sentinel or a stop request."""
+        while not self.processing_state.should_stop():
+            try:
+                item = q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is None:
+                return
+            yield item
+    
+    def _run_video_pipeline(self, frames: Iterable, total: int, output_dir: str,
+                            inputs: Dict[str, Any], progress_callback: Callable) -> List[str]:
+        """Remove backgrounds from video frames on a bounded worker pool.
+        
+        Workers decode, run the session and encode PNGs concurrently so the
+        accelerator isn't idle while a frame is being written. When the model
+        supports it, frames are grouped into batches of VIDEO_BATCH_SIZE that go
+        through a single session run. At most about two frames per worker are in
+        flight, and results are collected in frame order so progress and
+        previews advance monotonically.
+        
+        Args:
+            frames: Frame paths or decoded RGB arrays in video order; may still be streaming in
+            total: Expected number of frames, used for progress reporting
+            output_dir: Directory for the processed frames
+            inputs: Validated inputs from get_validated_inputs
+            progress_callback: Called as (current, total, status, input_frame, output_file, output_image)
+            
+        Returns:
+            Paths of the successfully processed frames, in order
+        """
+        batching = self.image_processor.supports_batching(inputs['alpha_matting'], inputs['extra_params'])
+        batch_size = VIDEO_BATCH_SIZE if batching else 1
+        max_pending = max(2, 2 * VIDEO_WORKERS // batch_size)
+        processed_frames = []
+        pending = deque()
+        
+        if self.logger and batching:
+            self.logger.info(f"Running inference in batches of {batch_size} frames")
+        
+        def process_frame(frame, output_file: str):
+            output_images = []
+            process = (self.image_processor.process_single_image if isinstance(frame, str)
+                       else self.image_processor.process_image)
+            if process(
+                frame, output_file,
+                inputs['only_mask'], inputs['alpha_matting'], inputs['extra_params'],
+                output_image_callback=output_images.append
+            ):
+                return output_images[0]
+            return None
+        
+        def process_batch(batch_frames: list, output_files: List[str]) -> list:
+            if self.processing_state.should_stop():
+                return [None] * len(batch_frames)
+            if len(batch_frames) == 1:
+                return [process_frame(batch_frames[0], output_files[0])]
+            return self.image_processor.process_image_batch(batch_frames, output_files, inputs['only_mask'])
+        
+        def collect_oldest():
+            start_index, batch_frames, output_files, future = pending.popleft()
+            for index, frame, output_file, output_image in zip(
+                range(start_index, start_index + len(batch_frames)), batch_frames, output_files, future.result()
+            ):
+                frame_name = os.path.basename(frame) if isinstance(frame, str) else f"frame_{index:06d}"
+                current_total = max(total, index + 1)  # total is only an estimate while streaming
+                if output_image is not None:
+                    processed_frames.append(output_file)
+                    progress_callback(index + 1, current_total, f"Completed: {frame_name}",
+                                      frame, output_file, output_image)
+                else:
+                    progress_callback(index + 1, current_total, f"Failed: {frame_name}", frame, None)
+        
+        with ThreadPoolExecutor(max_workers=VIDEO_WORKERS, thread_name_prefix="rembg_frame") as executor:
+            start_index = 0
+            batch_frames, output_files = [], []
+            
+            for index, frame in enumerate(frames):
+                if self.processing_state.should_stop():
+                    batch_frames = []
+                    break
+                
+                batch_frames.append(frame)
+                output_files.append(os.path.join(output_dir, f"frame_{index:06d}_no_bg.png"))
+                if len(batch_frames) < batch_size:
+                    continue
+                
+                pending.append((start_index, batch_frames, output_files,
+                                executor.submit(process_batch, batch_frames, output_files)))
+                start_index = index + 1
+                batch_frames, output_files = [], []
+                
+                # Backpressure: wait for the oldest batch before queueing more
+                if len(pending) >= max_pending:
+                    collect_oldest()
+            
+            # Flush a final partial batch
+            if batch_frames:
+                pending.append((start_index, batch_frames, output_files,
+                                executor.submit(process_batch, batch_frames, output_files)))
+            
+            while pending:
+                collect_oldest()
+        
+        return processed_frames
+    
     def start_processing(self):
         """Start the processing in a separate thread."""
-        if not self.processing_state.start_processing():
+        if self.processing_state.is_processing():
             return  # Already processing
         
-        if not CORE_AVAILABLE:
+        if not CORE_AVAILABLE or self._core_load_failed:
             messagebox.showerror("Error", "Core processing modules not available")
-            self.processing_state.finish_processing()
             return
         
+        if self.image_processor is None or self._startup_tasks:
+            messagebox.showinfo("Please Wait", "Still loading processing modules and detecting the GPU")
+            return
+        
+        # Validate on the Tk thread: it only reads widget variables, and invalid
+        # input then never starts a worker thread
+        is_valid, error_msg, inputs = self.get_validated_inputs()
+        if not is_valid:
+            messagebox.showerror("Input Error", error_msg)
+            return
+        
+        if not self.processing_state.start_processing():
+            return  # Already processing
+        
         try:
-            if hasattr(self, 'control_frame') and self.control_frame:
+            if self.control_frame is not None:
                 self.control_frame.set_processing_state(True)
             
             # Set image processor processing state
             if self.image_processor:
                 self.image_processor.set_processing(True)
             
-            thread = threading.Thread(target=self.processing_thread, daemon=True)
+            thread = threading.Thread(target=self.processing_thread, args=(inputs,), daemon=True)
             thread.start()
             
         except Exception as e:
@@ -929,13 +1429,8 @@ class MainWindow:
     def on_window_close(self):
         """Handle window close event."""
         try:
-            # Stop processing
-            self.processing_state.stop_processing()
-            
-            # Cleanup
-            for temp_dir in self.temp_directories:
-                if UTILS_AVAILABLE:
-                    safe_remove_directory(temp_dir)
+            # Stop processing and release resources
+            self._finalizer()
             
             # Destroy window
             self.root.destroy()
@@ -1,16 +1,18 @@
 """Image preview canvas component."""
 
+import os
 import tkinter as tk
 import weakref
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Callable
 
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageColor, ImageTk
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
-from config.settings import CANVAS_WIDTH, CANVAS_HEIGHT
+from config.settings import CANVAS_WIDTH, CANVAS_HEIGHT, CANVAS_BACKGROUND
 
 try:
     from utils.logging_utils import Logger
@@ -19,12 +21,74 @@ except ImportError:
     LOGGING_AVAILABLE = False
 
 
+def _fit_to_canvas(img, canvas_width: int, canvas_height: int):
+    """Flatten transparency onto white and resize to fit the canvas, keeping aspect ratio."""
+    if not isinstance(img, Image.Image):
+        img = Image.fromarray(img)
+    
+    # Convert to RGB if necessary; transparency is flattened after resizing
+    if img.mode not in ('RGB', 'RGBA', 'LA'):
+        img = img.convert('RGB')
+    
+    # Calculate resize dimensions maintaining aspect ratio
+    img_width, img_height = img.size
+    aspect_ratio = img_width / img_height
+    
+    # Calculate new dimensions to fit in canvas
+    canvas_width -= 20  # Leave margin
+    canvas_height -= 20
+    
+    if aspect_ratio > canvas_width / canvas_height:
+        # Image is wider, fit to width
+        new_width = canvas_width
+        new_height = int(new_width / aspect_ratio)
+    else:
+        # Image is taller, fit to height
+        new_height = canvas_height
+        new_width = int(new_height * aspect_ratio)
+    
+    # Bilinear is indistinguishable from Lanczos at preview size once the image
+    # shrinks by 2x or more, and much cheaper on large frames
+    if img_width >= 2 * new_width:
+        resample = Image.Resampling.BILINEAR
+    else:
+        resample = Image.Resampling.LANCZOS
+    
+    # Resize the image
+    img = img.resize((new_width, new_height), resample)
+    
+    if img.mode in ('RGBA', 'LA'):
+        # Create white background for transparency, at preview size
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        img = background
+    
+    return img
+
+
+@lru_cache(maxsize=16)
+def _load_and_resize(image_path: str, mtime_ns: int, canvas_width: int, canvas_height: int):
+    """Decode and fit an image file to the canvas.
+    
+    mtime_ns is part of the cache key so a rewritten file is decoded again.
+    """
+    with Image.open(image_path) as img:
+        # Let libjpeg downscale while decoding; a no-op for other formats
+        img.draft('RGB', (canvas_width * 2, canvas_height * 2))
+        return _fit_to_canvas(img, canvas_width, canvas_height)
+
+
 class PreviewCanvas:
     """Handles image preview display in a canvas."""
     
+    # Canvas-sized RGB staging frame shared by all previews. Only touched on the
+    # Tk thread, and its pixels are copied into a PhotoImage straight away.
+    _staging_frame = None
+    
     def __init__(self, parent, title: str, logger=None):
         self.logger = logger
-        self._image_references = []  # Track image references for cleanup
+        self._photo_pool = None  # Two canvas-sized PhotoImages, repainted alternately
+        self._pool_idx = 0
         self._container_ref = None
         self._canvas_ref = None
         self.setup_ui(parent, title)
@@ -52,7 +116,7 @@ class PreviewCanvas:
                 self.container, 
                 width=CANVAS_WIDTH, 
                 height=CANVAS_HEIGHT,
-                bg="lightgray", 
+                bg=CANVAS_BACKGROUND, 
                 relief="sunken", 
                 bd=2
             )
@@ -78,7 +142,8 @@ class PreviewCanvas:
         
     def cleanup_image_references(self):
         """Clean up stored image references to prevent memory leaks."""
-        self._image_references.clear()
+        self._photo_pool = None
+        _load_and_resize.cache_clear()
         
         def clear_canvas_image(canvas):
             if hasattr(canvas, 'image'):
@@ -94,63 +159,73 @@ class PreviewCanvas:
             return None
             
         try:
-            with Image.open(image_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'LA'):
-                    # Create white background for transparency
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'RGBA':
-                        background.paste(img, mask=img.split()[-1])
-                    else:
-                        background.paste(img, mask=img.split()[-1])
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Calculate resize dimensions maintaining aspect ratio
-                img_width, img_height = img.size
-                aspect_ratio = img_width / img_height
-                
-                # Calculate new dimensions to fit in canvas
-                canvas_width = CANVAS_WIDTH - 20  # Leave margin
-                canvas_height = CANVAS_HEIGHT - 20
-                
-                if aspect_ratio > canvas_width / canvas_height:
-                    # Image is wider, fit to width
-                    new_width = canvas_width
-                    new_height = int(new_width / aspect_ratio)
-                else:
-                    # Image is taller, fit to height
-                    new_height = canvas_height
-                    new_width = int(new_height * aspect_ratio)
-                
-                # Resize the image
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # Create PhotoImage and track reference
-                photo = ImageTk.PhotoImage(img)
-                self._image_references.append(photo)
-                
-                # Clean up old references if too many
-                if len(self._image_references) > 5:
-                    self._image_references = self._image_references[-3:]
-                
-                return photo
+            mtime_ns = os.stat(image_path).st_mtime_ns
+            img = _load_and_resize(image_path, mtime_ns, CANVAS_WIDTH, CANVAS_HEIGHT)
+            return self._to_photo(img)
                 
+        except FileNotFoundError:
+            # Output not written yet; callers decide what to show instead
+            return None
         except Exception as e:
-            if self.logger and LOGGING_AVAILABLE:
+            if self.logger and LOGGING_AVAILABLE and self.logger.is_debug():
                 self.logger.debug(f"Error loading preview image: {e}")
             return None
     
-    def update_image(self, image_path: str):
-        """Update the canvas with a new image."""
+    def resize_pil_image_for_canvas(self, img) -> Optional[ImageTk.PhotoImage]:
+        """Resize an in-memory PIL image or ndarray to fit in canvas."""
+        if not PIL_AVAILABLE:
+            return None
+        
+        try:
+            return self._to_photo(_fit_to_canvas(img, CANVAS_WIDTH, CANVAS_HEIGHT))
+        except Exception as e:
+            if self.logger and LOGGING_AVAILABLE and self.logger.is_debug():
+                self.logger.debug(f"Error loading preview image: {e}")
+            return None
+    
+    def _to_photo(self, img) -> ImageTk.PhotoImage:
+        """Paint a fitted PIL image, centered, into the next pooled PhotoImage.
+        
+        The pool holds two fixed canvas-sized PhotoImages that are repainted in
+        turn, so preview updates never allocate new Tk images.
+        """
+        if self._photo_pool is None:
+            self._photo_pool = [
+                ImageTk.PhotoImage('RGB', (CANVAS_WIDTH, CANVAS_HEIGHT)) for _ in range(2)
+            ]
+        
+        if PreviewCanvas._staging_frame is None:
+            PreviewCanvas._staging_frame = Image.new('RGB', (CANVAS_WIDTH, CANVAS_HEIGHT))
+        frame = PreviewCanvas._staging_frame
+        frame.paste(ImageColor.getrgb(CANVAS_BACKGROUND), (0, 0, CANVAS_WIDTH, CANVAS_HEIGHT))
+        frame.paste(img, ((CANVAS_WIDTH - img.width) // 2, (CANVAS_HEIGHT - img.height) // 2))
+        
+        photo = self._photo_pool[self._pool_idx]
+        self._pool_idx ^= 1
+        photo.paste(frame)
+        return photo
+    
+    def update_image(self, image_path: str) -> bool:
+        """Update the canvas with a new image.
+        
+        Returns:
+            True if the image was loaded and displayed
+        """
+        return self._display_photo(lambda: self.resize_image_for_canvas(image_path))
+    
+    def update_image_from_pil(self, image) -> bool:
+        """Update the canvas with an already-decoded PIL image or ndarray."""
+        return self._display_photo(lambda: self.resize_pil_image_for_canvas(image))
+    
+    def _display_photo(self, create_photo: Callable) -> bool:
+        """Clear the canvas and show the photo produced by create_photo centered."""
         def update_operation(canvas):
             try:
                 # Clear canvas
                 canvas.delete("all")
                 
                 # Load and resize image
-                photo = self.resize_image_for_canvas(image_path)
+                photo = create_photo()
                 if photo:
                     # Calculate center position
                     canvas_width = canvas.winfo_width()
@@ -165,15 +240,17 @@ class PreviewCanvas:
                     # Display image centered
                     canvas.create_image(center_x, center_y, image=photo, anchor=tk.CENTER)
                     canvas.image = photo  # Keep a reference
+                    return True
                 else:
                     self._set_canvas_message(canvas, "Error loading image", "red")
                     
             except Exception as e:
-                if self.logger and LOGGING_AVAILABLE:
+                if self.logger and LOGGING_AVAILABLE and self.logger.is_debug():
                     self.logger.debug(f"Error updating preview: {e}")
                 self._set_canvas_message(canvas, "Error loading preview", "red")
+            return False
         
-        self._safe_canvas_operation(update_operation)
+        return bool(self._safe_canvas_operation(update_operation))
     
     def _set_canvas_message(self, canvas, message: str, color: str = "darkgray"):
         """Set a message on the canvas."""
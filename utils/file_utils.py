@@ -2,6 +2,7 @@
 
 import os
 import shutil
+import stat
 import time
 from pathlib import Path
 from typing import List, Callable, Optional, Tuple
@@ -15,16 +16,45 @@ except ImportError:
 
 from config.settings import IMAGE_EXTENSIONS, MAX_IMAGE_SIZE_MB, MAX_VIDEO_SIZE_MB
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Lowercased image extensions and the longest one, for a cheap length reject
+_IMG_EXTS = frozenset(ext.lower() for ext in IMAGE_EXTENSIONS)
+_IMG_EXT_MAX_LEN = max(len(ext) for ext in _IMG_EXTS)
+
+DISK_SPACE_CACHE_TTL = 2.0  # Seconds a free-space reading is reused
+DISK_SPACE_CACHE_SIZE = 32  # Directories remembered before the oldest is dropped
+
+# Characters problematic on Windows/Unix become '_', control characters are removed
+_SAFE_FILENAME_TABLE = str.maketrans(
+    {**{char: '_' for char in '<>:"/\\|?*'}, **{chr(code): None for code in range(32)}}
+)
+
+# directory as given -> (monotonic timestamp, free MB), oldest entry first
+_disk_space_cache = {}
+
 
 def find_image_files(directory: str) -> List[Path]:
     """Find all image files in a directory recursively."""
     image_files = []
-    try:
-        for file_path in Path(directory).rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in IMAGE_EXTENSIONS:
-                image_files.append(file_path)
-    except (PermissionError, OSError) as e:
-        print(f"Error accessing directory {directory}: {e}")
+    pending_dirs = [directory]
+    
+    # Iterative scandir walk: DirEntry caches file type, so no stat per entry
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if (dot > 0 and len(name) - dot <= _IMG_EXT_MAX_LEN
+                                and name[dot:].lower() in _IMG_EXTS):
+                            image_files.append(Path(entry.path))
+        except (PermissionError, OSError) as e:
+            print(f"Error accessing directory {current_dir}: {e}")
     
     return image_files
 
@@ -53,15 +83,30 @@ def download_file(url: str, filepath: Path, progress_callback: Optional[Callable
         print("URL download not available - missing urllib")
         return False
     
-    def progress_hook(block_num, block_size, total_size):
-        if progress_callback and total_size > 0:
-            downloaded = block_num * block_size
-            percentage = min(100, (downloaded / total_size) * 100)
-            progress_callback(downloaded, total_size, percentage)
-    
     try:
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        urllib.request.urlretrieve(url, filepath, reporthook=progress_hook)
+        with urllib.request.urlopen(url, timeout=30) as response, open(filepath, 'wb') as f:
+            total_size = int(response.headers.get('Content-Length') or 0)
+            
+            # Read 1 MiB at a time into a reused buffer
+            buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+            view = memoryview(buffer)
+            downloaded = 0
+            next_report = 0
+            report_step = max(1, total_size // 20)  # At most every 5%
+            
+            while True:
+                n = response.readinto(view)
+                if not n:
+                    break
+                f.write(view[:n])
+                downloaded += n
+                
+                if progress_callback and total_size > 0 and (downloaded >= next_report or downloaded >= total_size):
+                    percentage = min(100, (downloaded / total_size) * 100)
+                    progress_callback(downloaded, total_size, percentage)
+                    next_report = downloaded + report_step
+        
         return True
     except (urllib.error.URLError, OSError, PermissionError) as e:
         print(f"Error downloading {url}: {e}")
@@ -109,7 +154,10 @@ def safe_remove_directory(directory: str, max_retries: int = 3) -> bool:
             return True
         except (PermissionError, OSError) as e:
             if attempt < max_retries - 1:
-                time.sleep(0.5)  # Wait before retry
+                # Read-only files are the usual culprit on Windows; clear the bit and retry
+                if attempt == 0 and os.name == 'nt' and isinstance(e, PermissionError):
+                    _clear_readonly(directory)
+                time.sleep(0.02 * (4 ** attempt))  # Back off: 20 ms, 80 ms, 320 ms, ...
                 continue
             else:
                 print(f"Failed to remove directory {directory} after {max_retries} attempts: {e}")
@@ -123,18 +171,31 @@ def safe_remove_directory(directory: str, max_retries: int = 3) -> bool:
     return False
 
 
-def validate_file_size(filepath: str, is_video: bool = False) -> Tuple[bool, str]:
+def _clear_readonly(directory: str) -> None:
+    """Make every entry under directory writable so it can be deleted."""
+    for root, dirs, files in os.walk(directory, topdown=False):
+        for name in files + dirs:
+            try:
+                os.chmod(os.path.join(root, name), stat.S_IWRITE)
+            except OSError:
+                pass
+
+
+def validate_file_size(filepath: str, is_video: bool = False, 
+                       size_mb: Optional[float] = None) -> Tuple[bool, str]:
     """Validate if file size is within acceptable limits.
     
     Args:
         filepath: Path to the file to check
         is_video: True if this is a video file
+        size_mb: Precomputed file size in MB (skips the stat call when given)
         
     Returns:
         Tuple of (is_valid, error_message)
     """
     try:
-        size_mb = get_file_size_mb(filepath)
+        if size_mb is None:
+            size_mb = get_file_size_mb(filepath)
         max_size = MAX_VIDEO_SIZE_MB if is_video else MAX_IMAGE_SIZE_MB
         file_type = "Video" if is_video else "Image"
         
@@ -149,15 +210,9 @@ def validate_file_size(filepath: str, is_video: bool = False) -> Tuple[bool, str
 
 def get_safe_filename(filename: str) -> str:
     """Get a safe filename by removing/replacing problematic characters."""
-    # Remove or replace characters that are problematic on Windows/Unix
-    unsafe_chars = '<>:"/\\|?*'
-    safe_name = filename
-    
-    for char in unsafe_chars:
-        safe_name = safe_name.replace(char, '_')
-    
-    # Remove any control characters
-    safe_name = ''.join(char for char in safe_name if ord(char) >= 32)
+    # Replace characters that are problematic on Windows/Unix and drop
+    # control characters in a single pass
+    safe_name = filename.translate(_SAFE_FILENAME_TABLE)
     
     # Ensure it's not empty and doesn't start/end with spaces or dots
     safe_name = safe_name.strip(' .')
@@ -178,6 +233,12 @@ def check_disk_space(directory: str, required_mb: float) -> bool:
         True if enough space is available
     """
     try:
+        # Free space doesn't change materially between frames, so reuse recent readings
+        now = time.monotonic()
+        cached = _disk_space_cache.get(directory)
+        if cached and now - cached[0] < DISK_SPACE_CACHE_TTL:
+            return cached[1] >= required_mb
+        
         if os.name == 'nt':  # Windows
             free_bytes = shutil.disk_usage(directory).free
         else:  # Unix-like
@@ -185,6 +246,10 @@ def check_disk_space(directory: str, required_mb: float) -> bool:
             free_bytes = statvfs.f_frsize * statvfs.f_bavail
         
         free_mb = free_bytes / (1024**2)
+        _disk_space_cache.pop(directory, None)
+        if len(_disk_space_cache) >= DISK_SPACE_CACHE_SIZE:
+            del _disk_space_cache[next(iter(_disk_space_cache))]
+        _disk_space_cache[directory] = (now, free_mb)
         return free_mb >= required_mb
         
     except (OSError, AttributeError):
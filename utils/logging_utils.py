@@ -12,6 +12,10 @@ class Logger:
         self.gui_callback = gui_callback
         self.debug_mode = debug_mode
     
+    def is_debug(self) -> bool:
+        """Check if debug messages are emitted, so callers can skip building them."""
+        return self.debug_mode
+    
     def debug(self, message: str) -> None:
         """Log debug message."""
         if self.debug_mode:
@@ -1,82 +1,399 @@
 """System utilities for hardware detection and monitoring."""
 
+import atexit
+import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from typing import List, Dict, Any, NamedTuple, Optional
+
 import psutil
-from typing import List, Dict, Any, Optional
 
-try:
-    import onnxruntime as ort
-    ONNX_AVAILABLE = True
-except ImportError:
-    ONNX_AVAILABLE = False
+# onnxruntime is a large native library, so it is only imported once a GPU
+# check actually needs it (see _get_ort)
+_ort = None
+_ort_checked = False
+
+
+class MemoryUsage(NamedTuple):
+    """System memory snapshot in GB."""
+    total_gb: float
+    available_gb: float
+    used_gb: float
+    percent: float
+
+
+class Snapshot(NamedTuple):
+    """System info, memory usage and a file fit check from one memory reading."""
+    system_info: Dict[str, Any]
+    memory_usage: MemoryUsage
+    file_fits: Optional[bool]
+
+
+_GIB = 1 << 30
+_INV_GIB = 1.0 / _GIB
+
+# Parts of get_system_info() that are fixed for the life of the process
+_STATIC_INFO = {
+    'python_version': sys.version,
+    'platform': sys.platform
+}
+
+# Installed memory doesn't change at runtime
+_TOTAL_GB = psutil.virtual_memory().total * _INV_GIB
+
+# Provider lists never change during a run, so the GPU probe is done once
+_gpu_info_cache = None
+_cuda_verify_done = False
+_cuda_verified = None
+_cuda_warm_started = False
+
+# Directories from get_safe_temp_directory, removed by one atexit handler
+_TEMP_DIRS: List[str] = []
+_temp_dirs_lock = threading.Lock()
+_temp_cleanup_registered = False
+_temp_root = None
+
+# Providers that mean a CUDA-class GPU, including ROCm builds that expose
+# HIP or MIGraphX instead of (or as well as) ROCMExecutionProvider
+GPU_PROVIDERS = frozenset({
+    'CUDAExecutionProvider',
+    'ROCMExecutionProvider',
+    'HIPExecutionProvider',
+    'MIGraphXExecutionProvider',
+})
+
+# Execution providers from fastest to slowest, used to rank what ONNX Runtime offers
+PROVIDER_PREFERENCE = (
+    'TensorrtExecutionProvider',
+    'CUDAExecutionProvider',
+    'ROCMExecutionProvider',
+    'MIGraphXExecutionProvider',
+    'DmlExecutionProvider',
+    'CoreMLExecutionProvider',
+    'OpenVINOExecutionProvider',
+    'CPUExecutionProvider',
+)
+
+# Available memory is sampled at most once per MEMORY_CACHE_TTL seconds, so
+# pre-flight checks over a batch of files share one reading
+MEMORY_CACHE_TTL = 0.25
+_mem_cache = {'ts': 0.0, 'avail': 0}
+
+_IS_LINUX = sys.platform.startswith('linux')
+
+
+def _read_mem_available() -> Optional[int]:
+    """Read MemAvailable from /proc/meminfo, or None if it can't be found."""
+    try:
+        with open('/proc/meminfo', 'rb') as f:
+            for line in f:
+                if line.startswith(b'MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _available_bytes(fresh: bool = False) -> int:
+    """Return available system memory in bytes, reusing a recent reading."""
+    now = time.monotonic()
+    if fresh or now - _mem_cache['ts'] >= MEMORY_CACHE_TTL:
+        available = _read_mem_available() if _IS_LINUX else None
+        if available is None:
+            available = psutil.virtual_memory().available
+        _mem_cache['avail'] = available
+        _mem_cache['ts'] = now
+    return _mem_cache['avail']
 
 
 def get_system_info() -> Dict[str, Any]:
     """Get basic system information."""
-    return {
-        'python_version': sys.version,
-        'platform': sys.platform,
-        'available_memory_gb': psutil.virtual_memory().available / (1024**3)
+    system_info = _STATIC_INFO.copy()
+    system_info['available_memory_gb'] = _available_bytes() * _INV_GIB
+    return system_info
+
+
+def check_gpu_availability(verify: bool = False) -> Dict[str, Any]:
+    """Check if GPU acceleration is available.
+    
+    The result is computed once per process; each call gets its own copy.
+    When CUDA is available, its libraries are loaded once ahead of the first
+    real session: by the verification run, or otherwise on a background thread.
+    
+    Args:
+        verify: Run a tiny inference on CUDA to confirm it really works, since
+            a listed CUDA provider can still fail on driver or cuDNN mismatch.
+            The probe runs once and its outcome is cached. 'cuda_verified' is
+            then True, False, or None if the probe couldn't be run
+    """
+    global _gpu_info_cache, _cuda_verify_done, _cuda_verified, _cuda_warm_started
+    
+    if _gpu_info_cache is None:
+        _gpu_info_cache = _probe_gpu()
+    
+    gpu_info = {
+        **_gpu_info_cache,
+        'providers': list(_gpu_info_cache['providers']),
+        'preferred_providers': list(_gpu_info_cache['preferred_providers'])
     }
+    
+    if verify and gpu_info['cuda_available']:
+        if not _cuda_verify_done:
+            _cuda_verified = _verify_cuda()
+            _cuda_verify_done = True
+        gpu_info['cuda_verified'] = _cuda_verified
+        if _cuda_verified is False:
+            gpu_info['cuda_available'] = False
+            gpu_info['tensorrt_available'] = False
+            gpu_info['gpu_provider'] = next(
+                (p for p in gpu_info['providers']
+                 if p in GPU_PROVIDERS and p != 'CUDAExecutionProvider'),
+                None
+            )
+            gpu_info['gpu_available'] = gpu_info['gpu_provider'] is not None
+            gpu_info['preferred_providers'] = [
+                p for p in gpu_info['preferred_providers']
+                if p not in ('TensorrtExecutionProvider', 'CUDAExecutionProvider')
+            ]
+    
+    # A completed verification has already loaded the libraries on this thread
+    if gpu_info['cuda_available'] and _cuda_verified is not True and not _cuda_warm_started:
+        _cuda_warm_started = True
+        threading.Thread(target=_warm_cuda_provider, name="ort-warmup", daemon=True).start()
+    
+    return gpu_info
 
 
-def check_gpu_availability() -> Dict[str, Any]:
-    """Check if GPU acceleration is available."""
+def _get_ort():
+    """Import onnxruntime on first use; returns None if it isn't installed."""
+    global _ort, _ort_checked
+    
+    if not _ort_checked:
+        try:
+            import onnxruntime
+            _ort = onnxruntime
+        except ImportError:
+            pass
+        _ort_checked = True
+    
+    return _ort
+
+
+def _probe_gpu() -> Dict[str, Any]:
+    """Query ONNX Runtime for its execution providers."""
     gpu_info = {
         'cuda_available': False,
         'rocm_available': False,
-        'providers': []
+        'gpu_available': False,
+        'gpu_provider': None,
+        'tensorrt_available': False,
+        'directml_available': False,
+        'coreml_available': False,
+        'openvino_available': False,
+        'providers': [],
+        'preferred_providers': []
     }
     
-    if not ONNX_AVAILABLE:
+    ort = _get_ort()
+    if ort is None:
         return gpu_info
     
     try:
         providers = ort.get_available_providers()
         gpu_info['providers'] = providers
+        provider_set = frozenset(providers)
         
         # CUDA check
-        cuda_available = 'CUDAExecutionProvider' in providers
+        cuda_available = 'CUDAExecutionProvider' in provider_set
         gpu_info['cuda_available'] = cuda_available
         
         # ROCM check
-        rocm_available = 'ROCMExecutionProvider' in providers
+        rocm_available = 'ROCMExecutionProvider' in provider_set
         gpu_info['rocm_available'] = rocm_available
         
+        # Any CUDA or ROCm-family provider, whatever name the build uses
+        # ONNX Runtime lists providers highest priority first
+        gpu_info['gpu_provider'] = next((p for p in providers if p in GPU_PROVIDERS), None)
+        gpu_info['gpu_available'] = gpu_info['gpu_provider'] is not None
+        
+        # Other accelerators
+        gpu_info['tensorrt_available'] = 'TensorrtExecutionProvider' in provider_set
+        gpu_info['directml_available'] = 'DmlExecutionProvider' in provider_set
+        gpu_info['coreml_available'] = 'CoreMLExecutionProvider' in provider_set
+        gpu_info['openvino_available'] = 'OpenVINOExecutionProvider' in provider_set
+        
+        # Known providers best-first, so sessions can request them explicitly
+        gpu_info['preferred_providers'] = [
+            p for p in PROVIDER_PREFERENCE if p in provider_set
+        ]
+        
     except Exception as e:
         print(f"Error checking GPU availability: {e}")
     
     return gpu_info
 
 
-def get_memory_usage() -> Dict[str, float]:
+def _pb_varint(value: int) -> bytes:
+    """Encode a non-negative int as a protobuf varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _pb_int(field: int, value: int) -> bytes:
+    """Encode a varint protobuf field."""
+    return _pb_varint(field << 3) + _pb_varint(value)
+
+
+def _pb_bytes(field: int, data) -> bytes:
+    """Encode a length-delimited protobuf field (bytes, str or submessage)."""
+    if isinstance(data, str):
+        data = data.encode()
+    return _pb_varint(field << 3 | 2) + _pb_varint(len(data)) + data
+
+
+def _matmul_model_bytes() -> bytes:
+    """Serialize a 1x1 float MatMul ONNX model (c = a @ b).
+    
+    The ModelProto is written by hand so the probe doesn't need the onnx
+    package, which the app doesn't otherwise depend on.
+    """
+    # TypeProto{tensor_type: {elem_type: FLOAT, shape: [1, 1]}}
+    dim = _pb_bytes(1, _pb_int(1, 1))
+    tensor_type = _pb_bytes(1, _pb_int(1, 1) + _pb_bytes(2, dim + dim))
+    
+    def value_info(name):
+        return _pb_bytes(1, name) + _pb_bytes(2, tensor_type)
+    
+    node = _pb_bytes(1, 'a') + _pb_bytes(1, 'b') + _pb_bytes(2, 'c') + _pb_bytes(4, 'MatMul')
+    graph = (_pb_bytes(1, node) + _pb_bytes(2, 'cuda_check')
+             + _pb_bytes(11, value_info('a')) + _pb_bytes(11, value_info('b'))
+             + _pb_bytes(12, value_info('c')))
+    
+    # ir_version 7, default-domain opset 13
+    return _pb_int(1, 7) + _pb_bytes(7, graph) + _pb_bytes(8, _pb_int(2, 13))
+
+
+def _create_cuda_session(disable_cpu_fallback: bool):
+    """Create a session for the probe model on the CUDA provider."""
+    ort = _get_ort()
+    sess_opts = ort.SessionOptions()
+    if disable_cpu_fallback:
+        sess_opts.add_session_config_entry('session.disable_cpu_ep_fallback', '1')
+    return ort.InferenceSession(
+        _matmul_model_bytes(), sess_opts, providers=['CUDAExecutionProvider']
+    )
+
+
+def _verify_cuda() -> Optional[bool]:
+    """Run a 1x1 MatMul on the CUDA provider with CPU fallback disabled.
+    
+    Creating the session also loads the CUDA provider, cuDNN and cuBLAS, so a
+    verification doubles as the warm-up done by _warm_cuda_provider.
+    
+    Returns:
+        True if it ran on CUDA, False if it failed, None if it couldn't be
+        tried (numpy missing)
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    
+    try:
+        session = _create_cuda_session(disable_cpu_fallback=True)
+        one = np.ones((1, 1), dtype=np.float32)
+        session.run(None, {'a': one, 'b': one})
+        return 'CUDAExecutionProvider' in session.get_providers()
+    except Exception as e:
+        print(f"CUDA provider listed but not usable: {e}")
+        return False
+
+
+def _warm_cuda_provider() -> None:
+    """Load the CUDA provider, cuDNN and cuBLAS by creating a throwaway session."""
+    try:
+        _create_cuda_session(disable_cpu_fallback=False)
+    except Exception:
+        pass  # Best effort; the real session reports any problem
+
+
+def get_memory_usage() -> MemoryUsage:
     """Get current memory usage in GB."""
+    return _memory_usage_from(_read_virtual_memory())
+
+
+def _read_virtual_memory():
+    """Take a full psutil memory reading and refresh the available-memory cache."""
     memory = psutil.virtual_memory()
-    return {
-        'total_gb': memory.total / (1024**3),
-        'available_gb': memory.available / (1024**3),
-        'used_gb': memory.used / (1024**3),
-        'percent': memory.percent
-    }
+    _mem_cache['avail'] = memory.available
+    _mem_cache['ts'] = time.monotonic()
+    return memory
 
 
-def check_available_memory_for_file(file_path: str, multiplier: float = 3.0) -> bool:
+def _memory_usage_from(memory) -> MemoryUsage:
+    """Build a MemoryUsage from a psutil virtual_memory() result."""
+    return MemoryUsage(
+        _TOTAL_GB,
+        memory.available * _INV_GIB,
+        memory.used * _INV_GIB,
+        memory.percent
+    )
+
+
+def snapshot(file_path: Optional[str] = None, multiplier: float = 3.0) -> Snapshot:
+    """Gather system info, memory usage and an optional file check in one pass.
+    
+    Args:
+        file_path: File to check against available memory, if any
+        multiplier: Memory multiplier passed through to the file check
+    
+    Returns:
+        Snapshot whose fields all come from a single virtual_memory() call;
+        file_fits is None when no file_path is given
+    """
+    memory = _read_virtual_memory()
+    
+    system_info = _STATIC_INFO.copy()
+    system_info['available_memory_gb'] = memory.available * _INV_GIB
+    
+    file_fits = None
+    if file_path is not None:
+        # The reading above just refreshed the cache the check reads from
+        file_fits = check_available_memory_for_file(file_path, multiplier)
+    
+    return Snapshot(system_info, _memory_usage_from(memory), file_fits)
+
+
+def check_available_memory_for_file(file_path: str, multiplier: float = 3.0,
+                                    file_size: Optional[int] = None,
+                                    fresh: bool = False) -> bool:
     """Check if there's enough memory to process a file.
     
     Args:
         file_path: Path to the file to check
         multiplier: Memory multiplier (image processing typically needs 2-4x file size)
+        file_size: Precomputed file size in bytes (skips the stat call when given)
+        fresh: Take a new memory reading instead of one up to MEMORY_CACHE_TTL old
     
     Returns:
         True if enough memory is available
     """
+    if file_size is None:
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            # Missing or unreadable files are reported by the caller's own checks
+            return True
+    
     try:
-        import os
-        file_size_gb = os.path.getsize(file_path) / (1024**3)
-        required_memory_gb = file_size_gb * multiplier
-        available_memory_gb = psutil.virtual_memory().available / (1024**3)
-        
-        return available_memory_gb >= required_memory_gb
+        return _available_bytes(fresh) >= int(file_size * multiplier)
     except Exception:
         # If we can't check, assume it's okay to proceed
         return True
@@ -84,21 +401,30 @@ def check_available_memory_for_file(file_path: str, multiplier: float = 3.0) ->
 
 def get_safe_temp_directory() -> str:
     """Get a safe temporary directory with proper cleanup handling."""
-    import tempfile
-    import atexit
-    import shutil
-    from pathlib import Path
+    global _temp_cleanup_registered, _temp_root
+    
+    # Resolve the temp root once rather than on every mkdtemp
+    if _temp_root is None:
+        _temp_root = tempfile.gettempdir()
     
     # Create temp directory with cleanup registration
-    temp_dir = tempfile.mkdtemp(prefix="rembg_")
+    temp_dir = tempfile.mkdtemp(prefix="rembg_", dir=_temp_root)
     
-    def cleanup_temp_dir():
-        """Cleanup function registered with atexit."""
-        try:
-            if Path(temp_dir).exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        except Exception:
-            pass  # Silent cleanup on exit
+    with _temp_dirs_lock:
+        _TEMP_DIRS.append(temp_dir)
+        if not _temp_cleanup_registered:
+            atexit.register(_cleanup_temp_dirs)
+            _temp_cleanup_registered = True
     
-    atexit.register(cleanup_temp_dir)
     return temp_dir
+
+
+def _cleanup_temp_dirs() -> None:
+    """Remove every directory handed out by get_safe_temp_directory (atexit)."""
+    with _temp_dirs_lock:
+        temp_dirs = _TEMP_DIRS[:]
+        _TEMP_DIRS.clear()
+    
+    for temp_dir in temp_dirs:
+        # ignore_errors also covers a directory that is already gone
+        shutil.rmtree(temp_dir, ignore_errors=True)